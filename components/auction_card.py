@@ -3,6 +3,7 @@
 """
 import streamlit as st
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from services import get_risk_emoji, get_risk_color
 
@@ -24,6 +25,12 @@ def format_price(price: int) -> str:
     """가격 포맷 (억/만원)"""
     if not price:
         return "-"
+    return _format_price_cached(price)
+
+
+@lru_cache(maxsize=4096)
+def _format_price_cached(price: int) -> str:
+    """가격 포맷 본체 (0/None 제외, 결과 캐시)"""
     if price >= 100000000:
         억 = price // 100000000
         만 = (price % 100000000) // 10000
@@ -25,6 +25,11 @@ RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")
 # DB
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), "database", "seogyeonga.db")
 
+# 로컬 캐시 디렉터리 (HTTP 응답 / 이미지 / PDF 분석 / 실시간 검색 결과, .gitignore 대상)
+CACHE_DIR = os.getenv(
+    "SEOGYEONGA_CACHE_DIR", os.path.join(os.path.dirname(__file__), "cache")
+)
+
 # ========== 크롤링 설정 ==========
 COURT_AUCTION_URL = "https://www.courtauction.go.kr"
 SEOUL_SIDO_CODE = "11"  # 서울
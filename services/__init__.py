@@ -5,7 +5,10 @@ from .news_crawler import (
 )
 from .notification import send_auction_reminder, KakaoNotifier, get_kakao_auth_url
 from .ai_analyzer import analyze_auction, get_ai, SeogyeongaAI, generate_appraisal_summary
-from .pdf_report import generate_auction_report, get_report_filename
+from .pdf_report import (
+    generate_auction_report, generate_auction_report_stream, get_report_filename,
+    clear_report_cache
+)
 from .image_crawler import get_auction_images, get_cached_images, get_sample_images
 from .appraisal_crawler import (
     get_appraisal_data, get_sample_appraisal_data,
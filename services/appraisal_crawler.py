@@ -12,6 +12,10 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import tempfile
 
+from services.logger import get_logger
+
+logger = get_logger("appraisal_crawler")
+
 # PDF 처리 라이브러리
 try:
     import fitz  # PyMuPDF
@@ -94,11 +98,11 @@ class AppraisalCrawler:
                 if 'pdf' in content_type.lower() or response.content[:4] == b'%PDF':
                     return response.content
 
-            print(f"[APPRAISAL] PDF 다운로드 실패: {response.status_code}")
+            logger.warning("[APPRAISAL] PDF 다운로드 실패: %s", response.status_code)
             return None
 
         except Exception as e:
-            print(f"[APPRAISAL] 다운로드 오류: {e}")
+            logger.error("[APPRAISAL] 다운로드 오류: %s", e)
             return None
 
     def save_pdf(self, pdf_bytes: bytes, filename: str) -> str:
@@ -143,7 +147,7 @@ class AppraisalParser:
 
                 doc.close()
             except Exception as e:
-                print(f"[PARSER] 이미지 추출 오류: {e}")
+                logger.error("[PARSER] 이미지 추출 오류: %s", e)
 
         return images
 
@@ -164,7 +168,7 @@ class AppraisalParser:
                         if page_text:
                             text += page_text + "\n\n"
             except Exception as e:
-                print(f"[PARSER] pdfplumber 오류: {e}")
+                logger.error("[PARSER] pdfplumber 오류: %s", e)
 
         elif HAS_PYMUPDF:
             try:
@@ -173,7 +177,7 @@ class AppraisalParser:
                     text += page.get_text() + "\n\n"
                 doc.close()
             except Exception as e:
-                print(f"[PARSER] PyMuPDF 텍스트 추출 오류: {e}")
+                logger.error("[PARSER] PyMuPDF 텍스트 추출 오류: %s", e)
 
         return text
 
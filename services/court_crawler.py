@@ -6,10 +6,35 @@ import os
 import re
 import json
 import time
+import functools
+import atexit
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, date
-from bs4 import BeautifulSoup
+from datetime import datetime, date, timedelta
+
+from config import CACHE_DIR
+from services.logger import get_logger
+
+logger = get_logger("court_crawler")
+
+# 빠른 JSON 파서 (선택적 import, bytes 본문을 바로 파싱)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP 캐시 (선택적 import)
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
 
 
 # ============================================================
@@ -28,6 +53,27 @@ API_ENDPOINTS = {
     "시군구목록": f"{COURT_BASE_URL}/RetrieveAucSigu.ajax",
 }
 
+# 구 API(목록 검색) 응답 인코딩
+LIST_PAGE_ENCODING = "euc-kr"
+
+# 사건 상세 조회 탭별 페이로드 키
+PAYLOAD_KEYS = {
+    "사건내역": "dma_srchCsDtlInf",
+    "기일내역": "dma_srchDxdyDtsLst",
+    "문건송달내역": "dma_srchDlvrOfdocDts",
+}
+
+# "아파트" 검색 시 포함할 물건 종류
+_APT_TYPES = frozenset({"아파트", "주상복합", "오피스텔"})
+
+# 사건 상세 조회 탭 목록
+CASE_DETAIL_TABS = ("사건내역", "기일내역", "문건송달내역")
+
+# 탭별 추가 파라미터
+_EXTRA = {
+    "문건송달내역": {"srchFlag": "F"},
+}
+
 # 기본 헤더
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -37,6 +83,21 @@ DEFAULT_HEADERS = {
     "Connection": "keep-alive",
 }
 
+# HTTP 캐시 설정 (검색/상세 조회 응답 재사용 - 같은 날 재크롤링 대비)
+CACHE_PATH = os.path.join(CACHE_DIR, "court_http.sqlite")
+CACHE_EXPIRE_AFTER = timedelta(hours=6)
+
+# 사건 상세 조회 결과 캐시 (프로세스 내 LRU, 기일/송달 내역이 바뀌므로 유효 시간 제한)
+CASE_DETAIL_CACHE_SIZE = 1024
+CASE_DETAIL_CACHE_TTL = 600  # 초 (10분)
+
+# 병렬 크롤링 설정 (동시 요청 수 / 초당 요청 수)
+MAX_WORKERS = 8
+NATIONWIDE_MAX_WORKERS = 12  # 법원별 팬아웃 (모든 법원이 같은 호스트 공유)
+CASE_BATCH_MAX_WORKERS = 10  # 사건번호 일괄 조회 (사건 x 탭 동시 요청 상한)
+CASE_DETAIL_MAX_CONCURRENCY = 10  # 프로세스 전체 사건 상세 API 동시 요청 상한
+REQUESTS_PER_SECOND = 5.0
+
 
 # ============================================================
 # 전국 74개 법원 코드 (courtAuctionCrawler 참고)
@@ -161,6 +222,21 @@ SEOUL_SGG_CODES = {
     "중랑구": "11260",
 }
 
+# 역방향 조회용 (시군구 코드 -> 구 이름)
+SEOUL_SGG_CODES_REVERSE = {v: k for k, v in SEOUL_SGG_CODES.items()}
+
+
+# ============================================================
+# 파싱용 정규식 (모듈 로드 시 1회 컴파일)
+# ============================================================
+_CASE_NO_RE = re.compile(r"(\d{4})타경(\d+)")
+_DATE_RE = re.compile(r"'(\d{4}-\d{2}-\d{2})'")
+_AREA_RE = re.compile(r'(\d+\.?\d*)㎡')
+_COUNT_RE = re.compile(r'(\d+)회')
+
+# 아파트, 빌라 등 이름 패턴 (주소에서 처음 나오는 건물명)
+_APT_NAME_RE = re.compile(r'([가-힣A-Za-z0-9]+(?:아파트|빌라|맨션|타워|파크))')
+
 
 # ============================================================
 # 사건번호 파싱 유틸리티
@@ -176,7 +252,7 @@ def parse_case_number(case_no: str) -> Tuple[str, str]:
         (연도, 번호6자리) 튜플
     """
     # "2022타경3944" -> ("2022", "003944")
-    match = re.match(r"(\d{4})타경(\d+)", case_no)
+    match = _CASE_NO_RE.match(case_no)
     if match:
         year = match.group(1)
         number = match.group(2).zfill(6)  # 6자리로 패딩
@@ -203,41 +279,203 @@ def format_case_number_for_api(case_no: str) -> str:
 # ============================================================
 # 메인 크롤러 클래스
 # ============================================================
+def _create_session() -> requests.Session:
+    """
+    HTTP 세션 생성 (연결 풀 + 재시도 어댑터 장착)
+
+    requests-cache가 설치되어 있으면 (URL, 요청 본문) 기준으로
+    검색/상세 조회 응답을 SQLite에 캐시하는 세션을 반환
+    """
+    if REQUESTS_CACHE_AVAILABLE:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        session = requests_cache.CachedSession(
+            CACHE_PATH,
+            backend="sqlite",
+            expire_after=CACHE_EXPIRE_AFTER,
+            allowable_methods=("GET", "POST"),
+            # 캐시 키는 메서드 + URL + 정규화된 요청 본문(form/JSON)만 사용
+            match_headers=False,
+            # 세션 쿠키 발급 페이지는 캐시하지 않음
+            urls_expire_after={f"{COURT_BASE_URL}/pgj/index.on": requests_cache.DO_NOT_CACHE},
+        )
+    else:
+        session = requests.Session()
+
+    # 병렬 크롤링 시 keep-alive 연결 재사용 + 일시 오류 재시도
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _ListPageXPaths:
+    """Ltbl_list 목록 테이블 추출용 XPath 모음 (최초 사용 시 lxml import 및 1회 컴파일)"""
+
+    def __init__(self):
+        from lxml import etree
+
+        self.table = etree.XPath(
+            "//table[contains(concat(' ', normalize-space(@class), ' '), ' Ltbl_list ')]"
+        )
+        self.tbody = etree.XPath(".//tbody")
+        self.row = etree.XPath(".//tr")
+        self.td = etree.XPath("./td")
+        self.div = etree.XPath(".//div")
+        self._text = etree.XPath(".//text()", smart_strings=False)
+
+    def texts(self, element) -> List[str]:
+        """요소 하위 텍스트 노드를 공백 제거 후 반환 (빈 문자열 제외)"""
+        return [t for t in (text.strip() for text in self._text(element)) if t]
+
+
+@functools.lru_cache(maxsize=1)
+def _list_page_xpaths() -> _ListPageXPaths:
+    """목록 파싱용 XPath 모음 반환"""
+    return _ListPageXPaths()
+
+
+# 가격 문자열에서 제거할 문자 (쉼표, "원", 공백)
+_PRICE_TRANS = str.maketrans("", "", ",원 ")
+
+
+def _extract_onclick_date(onclick: str) -> str:
+    """
+    onclick 스크립트에서 첫 번째 'YYYY-MM-DD' 날짜 추출
+
+    대부분 첫 번째 인자가 날짜이므로 슬라이스로 먼저 확인하고,
+    형식이 다르면 정규식으로 검색
+    """
+    idx = onclick.find("'")
+    if idx != -1:
+        candidate = onclick[idx + 1:idx + 11]
+        if (
+            len(candidate) == 10
+            and candidate[4] == "-"
+            and candidate[7] == "-"
+            and onclick[idx + 11:idx + 12] == "'"
+            and candidate[:4].isdigit()
+            and candidate[5:7].isdigit()
+            and candidate[8:].isdigit()
+        ):
+            return candidate
+
+    date_match = _DATE_RE.search(onclick)
+    return date_match.group(1) if date_match else ""
+
+
+def _parse_price(text: str) -> int:
+    """가격 문자열 -> 정수 (예: "1,234,000원" -> 1234000, 실패 시 0)"""
+    try:
+        return int(text.translate(_PRICE_TRANS))
+    except ValueError:
+        return 0
+
+
+def _make_soup(html: str):
+    """
+    BeautifulSoup 객체 생성 (lxml 파서 우선, 없으면 html.parser)
+
+    bs4는 HTML 응답을 파싱할 때만 필요하므로 지연 import
+    """
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    try:
+        return BeautifulSoup(html, "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(html, "html.parser")
+
+
+def _unpack_search_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """WebSquare 검색 결과 한 행을 경매 물건 딕셔너리로 변환"""
+    return {
+        "id": item.get("caseNo") or item.get("cano") or item.get("csNo"),
+        "court": item.get("cortNm") or item.get("courtName") or item.get("cortOfcNm"),
+        "case_no": item.get("caseNo") or item.get("cano") or item.get("csNo"),
+        "apt_name": item.get("objctNm") or item.get("bldgNm") or item.get("mtrNm"),
+        "address": item.get("adrJbrs") or item.get("address") or item.get("jbrsAddr"),
+        "area": float(item.get("ar", 0) or item.get("area", 0) or item.get("excsvAr", 0)),
+        "appraisal_price": int(item.get("aeeEvlAmt", 0) or item.get("appraisedValue", 0)),
+        "min_price": int(item.get("lwsDspslPrc", 0) or item.get("minBidPrice", 0)),
+        "auction_date": item.get("saleDtm") or item.get("auctionDate") or item.get("dxdyDt"),
+        "auction_count": int(item.get("slbdNo", 1) or item.get("bidCount", 1)),
+        "status": item.get("prcsSttsCd") or item.get("status"),
+    }
+
+
 class CourtAuctionCrawler:
-    """법원경매 크롤러 (신규 API)"""
+    """법원경매 크롤러 (신규 API)
+
+    HTTP 세션과 쿠키 초기화 상태는 프로세스 전체에서 공유
+    (인스턴스마다 메인 페이지 접속을 반복하지 않음)
+    """
+
+    _shared_session: Optional[requests.Session] = None
+    _shared_initialized = False
+    _lock = threading.Lock()
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(DEFAULT_HEADERS)
-        self._initialized = False
+        self.session = type(self)._get_shared_session()
+
+    @classmethod
+    def _get_shared_session(cls) -> requests.Session:
+        """공유 세션 반환 (최초 호출 시 생성)"""
+        with cls._lock:
+            if cls._shared_session is None:
+                session = _create_session()
+                session.headers.update(DEFAULT_HEADERS)
+                cls._shared_session = session
+                cls._shared_initialized = False
+            return cls._shared_session
+
+    @classmethod
+    def close(cls):
+        """공유 세션 종료"""
+        with cls._lock:
+            if cls._shared_session is not None:
+                cls._shared_session.close()
+            cls._shared_session = None
+            cls._shared_initialized = False
 
     def _init_session(self) -> bool:
-        """세션 초기화 (쿠키 획득)"""
-        if self._initialized:
+        """세션 초기화 (쿠키 획득, 프로세스당 1회)"""
+        cls = type(self)
+        if cls._shared_initialized:
             return True
 
+        # 네트워크 요청은 락 밖에서 수행 (동시 초기화 시 중복 GET 은 허용)
         try:
             # 메인 페이지 접속하여 세션 쿠키 획득
             response = self.session.get(
                 f"{COURT_BASE_URL}/pgj/index.on",
                 timeout=15
             )
+        except Exception as e:
+            logger.error("[CRAWLER] 세션 초기화 오류: %s", e)
+            return False
 
-            if response.status_code == 200:
+        if response.status_code != 200:
+            logger.warning("[CRAWLER] 세션 초기화 실패: %s", response.status_code)
+            return False
+
+        # 결과 반영만 락 안에서
+        with cls._lock:
+            if not cls._shared_initialized:
                 # Referer 헤더 추가
                 self.session.headers.update({
                     "Referer": f"{COURT_BASE_URL}/pgj/index.on"
                 })
-                self._initialized = True
-                print(f"[CRAWLER] 세션 초기화 성공")
-                return True
-            else:
-                print(f"[CRAWLER] 세션 초기화 실패: {response.status_code}")
-                return False
-
-        except Exception as e:
-            print(f"[CRAWLER] 세션 초기화 오류: {e}")
-            return False
+                cls._shared_initialized = True
+                logger.debug("[CRAWLER] 세션 초기화 성공")
+        return True
 
     def get_case_detail(
         self,
@@ -261,7 +499,7 @@ class CourtAuctionCrawler:
 
         court_code = COURT_CODES.get(court_name)
         if not court_code:
-            print(f"[CRAWLER] 알 수 없는 법원: {court_name}")
+            logger.warning("[CRAWLER] 알 수 없는 법원: %s", court_name)
             return None
 
         # 사건번호 포맷
@@ -270,51 +508,85 @@ class CourtAuctionCrawler:
         # API URL
         api_url = API_ENDPOINTS.get(tab)
         if not api_url:
-            print(f"[CRAWLER] 알 수 없는 탭: {tab}")
+            logger.warning("[CRAWLER] 알 수 없는 탭: %s", tab)
             return None
 
-        # 페이로드 키 매핑
-        payload_keys = {
-            "사건내역": "dma_srchCsDtlInf",
-            "기일내역": "dma_srchDxdyDtsLst",
-            "문건송달내역": "dma_srchDlvrOfdocDts",
-        }
+        try:
+            return _get_case_detail_cached(court_code, formatted_case_no, tab)
+        except _CaseDetailError as e:
+            logger.warning("[CRAWLER] %s", e)
+            return None
+        except Exception as e:
+            logger.error("[CRAWLER] 요청 오류: %s", e)
+            return None
+
+    def get_case_detail_all(
+        self,
+        court_name: str,
+        case_no: str,
+        tabs: List[str] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        사건 상세 정보 여러 탭 동시 조회 (같은 세션의 연결 풀 공유)
 
-        payload_key = payload_keys.get(tab, "dma_srchCsDtlInf")
+        Args:
+            court_name: 법원명 (예: "서울중앙지방법원")
+            case_no: 사건번호 (예: "2022타경3944")
+            tabs: 조회할 정보 종류 목록 (None이면 전체)
 
-        # 페이로드 구성
-        payload = {
-            payload_key: {
-                "cortOfcCd": court_code,
-                "csNo": formatted_case_no,
+        Returns:
+            {탭: 상세 정보 딕셔너리 또는 None}
+        """
+        target_tabs = list(tabs or CASE_DETAIL_TABS)
+        if not target_tabs or not self._init_session():
+            return {tab: None for tab in target_tabs}
+
+        with ThreadPoolExecutor(max_workers=len(target_tabs)) as executor:
+            futures = {
+                tab: executor.submit(self.get_case_detail, court_name, case_no, tab)
+                for tab in target_tabs
             }
-        }
+            return {tab: future.result() for tab, future in futures.items()}
 
-        # 문건송달내역의 경우 추가 파라미터
-        if tab == "문건송달내역":
-            payload[payload_key]["srchFlag"] = "F"
+    def get_case_detail_many(
+        self,
+        court_name: str,
+        case_nos: List[str],
+        tabs: List[str] = None,
+        max_workers: int = CASE_BATCH_MAX_WORKERS
+    ) -> Dict[str, Dict[str, Optional[Dict[str, Any]]]]:
+        """
+        여러 사건번호 상세 정보 일괄 조회 (사건 x 탭 요청을 한 풀에서 동시 실행)
 
-        try:
-            response = self.session.post(
-                api_url,
-                json=payload,
-                timeout=30
-            )
+        Args:
+            court_name: 법원명 (예: "서울중앙지방법원")
+            case_nos: 사건번호 목록
+            tabs: 조회할 정보 종류 목록 (None이면 전체)
+            max_workers: 동시 요청 수 상한
 
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    return data.get("data")
-                except json.JSONDecodeError:
-                    print(f"[CRAWLER] JSON 파싱 실패")
-                    return None
-            else:
-                print(f"[CRAWLER] API 요청 실패: {response.status_code}")
-                return None
+        Returns:
+            {사건번호: {탭: 상세 정보 딕셔너리 또는 None}}
+        """
+        target_tabs = list(tabs or CASE_DETAIL_TABS)
+        results = {case_no: {tab: None for tab in target_tabs} for case_no in case_nos}
+        if not target_tabs or not case_nos or not self._init_session():
+            return results
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                (case_no, tab): executor.submit(self.get_case_detail, court_name, case_no, tab)
+                for case_no in case_nos
+                for tab in target_tabs
+            }
+            for (case_no, tab), future in futures.items():
+                results[case_no][tab] = future.result()
 
-        except Exception as e:
-            print(f"[CRAWLER] 요청 오류: {e}")
-            return None
+        return results
+
+    def invalidate(self):
+        """사건 상세 조회 캐시 비우기"""
+        with _case_detail_cache_lock:
+            _case_detail_cache.clear()
 
     def search_auctions(
         self,
@@ -374,83 +646,115 @@ class CourtAuctionCrawler:
                 timeout=30
             )
 
-            # euc-kr 인코딩 설정
-            response.encoding = 'euc-kr'
-
             if response.status_code == 200:
-                # HTML 응답 파싱
-                items = self._parse_auction_list_html(response.text, sido_code, sgg_code)
+                # HTML 응답 파싱 (euc-kr 바이트를 lxml이 직접 디코딩, 아파트만 필터링)
+                allowed_types = _APT_TYPES if property_type == "아파트" else None
+                items, row_count = self._parse_auction_list_html(
+                    response.content, sido_code, sgg_code, allowed_types=allowed_types
+                )
 
-                # 아파트만 필터링
-                if property_type == "아파트":
-                    items = [item for item in items if item.get("item_type") in ["아파트", "주상복합", "오피스텔"]]
+                logger.debug("[CRAWLER] 검색 완료: sgg=%s page=%d rows=%d items=%d",
+                             sgg_code, page, row_count, len(items))
 
                 return {
                     "items": items,
                     "total": len(items),
+                    "row_count": row_count,
                     "page": page,
                     "source": "courtauction_api"
                 }
             else:
-                print(f"[CRAWLER] 검색 실패: {response.status_code}")
+                logger.warning("[CRAWLER] 검색 실패: %s", response.status_code)
                 return self._get_sample_data(sgg_code)
 
         except Exception as e:
-            print(f"[CRAWLER] 검색 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[CRAWLER] 검색 오류: %s", e)
             return self._get_sample_data(sgg_code)
 
-    def _parse_auction_list_html(self, html: str, sido_code: str, sgg_code: str) -> List[Dict[str, Any]]:
+    def _parse_auction_list_html(
+        self,
+        html: bytes,
+        sido_code: str,
+        sgg_code: str,
+        allowed_types: Optional[frozenset] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """
         구 API HTML 응답에서 경매 물건 목록 파싱
 
         테이블 구조: Ltbl_list 클래스의 테이블
+
+        Args:
+            html: 응답 본문 바이트 (euc-kr)
+            sido_code: 시도 코드
+            sgg_code: 시군구 코드
+            allowed_types: 포함할 물건 종류 (None이면 전체, 그 외 행은 파싱 생략)
+
+        Returns:
+            (경매 물건 리스트, 물건 종류 필터 전 데이터 행 수)
         """
-        soup = BeautifulSoup(html, 'html.parser')
         items = []
+        row_count = 0
+        if not html or not html.strip():
+            return items, row_count
 
-        # 테이블 찾기 (class="Ltbl_list")
-        table = soup.find('table', class_='Ltbl_list')
-        if not table:
-            print("[CRAWLER] 테이블을 찾을 수 없음")
-            return items
+        import lxml.html  # HTML 응답에서만 사용 (지연 import)
 
-        tbody = table.find('tbody')
-        if not tbody:
-            print("[CRAWLER] tbody를 찾을 수 없음")
-            return items
+        xpaths = _list_page_xpaths()
+        root = lxml.html.fromstring(html, parser=lxml.html.HTMLParser(encoding=LIST_PAGE_ENCODING))
 
-        rows = tbody.find_all('tr')
+        # 테이블 찾기 (class="Ltbl_list")
+        tables = xpaths.table(root)
+        if not tables:
+            logger.debug("[CRAWLER] 테이블을 찾을 수 없음")
+            return items, row_count
+
+        tbodies = xpaths.tbody(tables[0])
+        if not tbodies:
+            logger.debug("[CRAWLER] tbody를 찾을 수 없음")
+            return items, row_count
+
+        rows = xpaths.row(tbodies[0])
+
+        # 행 루프에서 반복 사용하는 함수는 지역 변수로 바인딩
+        td_xpath = xpaths.td
+        div_xpath = xpaths.div
+        texts_of = xpaths.texts
+        extract_apt_name = self._extract_apt_name
+        parse_area = self._parse_area
+        parse_auction_count = self._parse_auction_count
+        risk_for_count = _risk_for_count
 
         for row in rows:
             try:
-                cols = row.find_all('td')
+                cols = td_xpath(row)
                 if len(cols) < 7:
                     continue
+                row_count += 1
 
                 # 사건정보 (법원, 사건번호)
-                case_info_div = cols[1].find('div')
-                if not case_info_div:
+                case_info_divs = div_xpath(cols[1])
+                if not case_info_divs:
                     continue
 
-                case_texts = [t.strip() for t in case_info_div.stripped_strings]
+                case_texts = texts_of(case_info_divs[0])
                 court = case_texts[0] if len(case_texts) > 0 else ""
                 case_no = case_texts[1] if len(case_texts) > 1 else ""
 
                 # 물건정보 (물건번호, 물건종류)
-                item_texts = [t.strip() for t in cols[2].stripped_strings]
+                item_texts = texts_of(cols[2])
                 item_no = item_texts[0] if len(item_texts) > 0 else ""
                 item_type = item_texts[1] if len(item_texts) > 1 else ""
+                if allowed_types is not None and item_type not in allowed_types:
+                    continue
 
                 # 주소/면적
-                addr_div = cols[3].find('div')
-                if addr_div:
-                    addr_texts = [t.strip() for t in addr_div.stripped_strings]
+                addr_divs = div_xpath(cols[3])
+                if addr_divs:
+                    addr_texts = texts_of(addr_divs[0])
                     address = addr_texts[0] if len(addr_texts) > 0 else ""
                     area_info = addr_texts[1] if len(addr_texts) > 1 else ""
                 else:
-                    address = cols[3].get_text(strip=True)
+                    address = "".join(texts_of(cols[3]))
                     area_info = ""
 
                 # 주소 파싱
@@ -460,37 +764,34 @@ class CourtAuctionCrawler:
                 addr2 = addr_parts[2] if len(addr_parts) > 2 else ""  # 동
 
                 # 비고
-                remarks = cols[4].get_text(strip=True)
+                remarks = "".join(texts_of(cols[4]))
 
                 # 감정가/최저가
-                value_divs = cols[5].find_all('div')
+                value_divs = div_xpath(cols[5])
                 appraisal_price = 0
                 min_price = 0
                 if len(value_divs) >= 2:
-                    price_text1 = value_divs[0].get_text(strip=True).replace(",", "").replace("원", "")
-                    price_text2 = value_divs[1].get_text(strip=True).replace(",", "").replace("원", "")
-                    try:
-                        appraisal_price = int(price_text1) if price_text1.isdigit() else 0
-                        min_price = int(price_text2) if price_text2.isdigit() else 0
-                    except:
-                        pass
+                    appraisal_price = _parse_price("".join(texts_of(value_divs[0])))
+                    min_price = _parse_price("".join(texts_of(value_divs[1])))
 
                 # 입찰정보 (날짜)
-                auction_div = cols[6].find('div')
+                auction_divs = div_xpath(cols[6])
                 auction_date = ""
-                if auction_div:
+                if auction_divs:
+                    auction_div = auction_divs[0]
                     # onclick에서 날짜 추출 시도
                     onclick = auction_div.get('onclick', '')
                     if onclick:
-                        import re
-                        date_match = re.search(r"'(\d{4}-\d{2}-\d{2})'", onclick)
-                        if date_match:
-                            auction_date = date_match.group(1)
+                        auction_date = _extract_onclick_date(onclick)
                     if not auction_date:
-                        auction_date = auction_div.get_text(strip=True)
+                        auction_date = "".join(texts_of(auction_div))
 
                 # 상태
-                status = cols[7].get_text(strip=True) if len(cols) > 7 else ""
+                status = "".join(texts_of(cols[7])) if len(cols) > 7 else ""
+
+                # 위험도 계산 (유찰 횟수 기준 테이블 조회)
+                auction_count = parse_auction_count(remarks)
+                risk_level, risk_reason = risk_for_count(auction_count)
 
                 # 아이템 구성
                 auction_item = {
@@ -499,34 +800,30 @@ class CourtAuctionCrawler:
                     "case_no": case_no,
                     "item_no": item_no,
                     "item_type": item_type,
-                    "apt_name": self._extract_apt_name(address, item_type),
+                    "apt_name": extract_apt_name(address, item_type),
                     "address": address,
                     "addr0": addr0,
                     "addr1": addr1,
                     "addr2": addr2,
                     "area_info": area_info,
-                    "area": self._parse_area(area_info),
+                    "area": parse_area(area_info),
                     "appraisal_price": appraisal_price,
                     "min_price": min_price,
                     "auction_date": auction_date,
-                    "auction_count": self._parse_auction_count(remarks),
+                    "auction_count": auction_count,
                     "status": status,
                     "remarks": remarks,
-                    "risk_level": "안전",
-                    "risk_reason": "",
+                    "risk_level": risk_level,
+                    "risk_reason": risk_reason,
                 }
 
-                # 위험도 계산
-                auction_item["risk_level"] = calculate_risk_level(auction_item)
-                auction_item["risk_reason"] = get_risk_reason(auction_item)
-
                 items.append(auction_item)
 
             except Exception as e:
-                print(f"[CRAWLER] 행 파싱 오류: {e}")
+                logger.warning("[CRAWLER] 행 파싱 오류: %s", e)
                 continue
 
-        return items
+        return items, row_count
 
     def _extract_apt_name(self, address: str, item_type: str) -> str:
         """주소에서 아파트명 추출"""
@@ -534,18 +831,9 @@ class CourtAuctionCrawler:
             return item_type
 
         # 아파트, 빌라 등 이름 패턴
-        patterns = [
-            r'([가-힣A-Za-z0-9]+아파트)',
-            r'([가-힣A-Za-z0-9]+빌라)',
-            r'([가-힣A-Za-z0-9]+맨션)',
-            r'([가-힣A-Za-z0-9]+타워)',
-            r'([가-힣A-Za-z0-9]+파크)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, address)
-            if match:
-                return match.group(1)
+        match = _APT_NAME_RE.search(address)
+        if match:
+            return match.group(1)
 
         # 못 찾으면 주소의 마지막 부분 반환
         parts = address.split()
@@ -557,7 +845,7 @@ class CourtAuctionCrawler:
             return 0.0
 
         # "전용 84.5㎡" 또는 "84.5㎡" 패턴
-        match = re.search(r'(\d+\.?\d*)㎡', area_info)
+        match = _AREA_RE.search(area_info)
         if match:
             return float(match.group(1))
         return 0.0
@@ -568,7 +856,7 @@ class CourtAuctionCrawler:
             return 1
 
         # "신건", "2회", "3회 유찰" 등 패턴
-        match = re.search(r'(\d+)회', remarks)
+        match = _COUNT_RE.search(remarks)
         if match:
             return int(match.group(1))
 
@@ -579,30 +867,16 @@ class CourtAuctionCrawler:
 
     def _parse_search_result(self, data: Dict) -> Dict[str, Any]:
         """JSON 검색 결과 파싱"""
-        items = []
+        # WebSquare 응답 구조에 따라 파싱 (처음 찾은 목록 사용)
+        inner = data.get("data") or {}
+        result_list = (
+            inner.get("list")
+            or data.get("list")
+            or inner.get("dlt_srchMtrInfoLst")
+            or []
+        )
 
-        # WebSquare 응답 구조에 따라 파싱
-        result_list = data.get("data", {}).get("list", [])
-        if not result_list:
-            result_list = data.get("list", [])
-        if not result_list:
-            result_list = data.get("data", {}).get("dlt_srchMtrInfoLst", [])
-
-        for item in result_list:
-            auction = {
-                "id": item.get("caseNo") or item.get("cano") or item.get("csNo"),
-                "court": item.get("cortNm") or item.get("courtName") or item.get("cortOfcNm"),
-                "case_no": item.get("caseNo") or item.get("cano") or item.get("csNo"),
-                "apt_name": item.get("objctNm") or item.get("bldgNm") or item.get("mtrNm"),
-                "address": item.get("adrJbrs") or item.get("address") or item.get("jbrsAddr"),
-                "area": float(item.get("ar", 0) or item.get("area", 0) or item.get("excsvAr", 0)),
-                "appraisal_price": int(item.get("aeeEvlAmt", 0) or item.get("appraisedValue", 0)),
-                "min_price": int(item.get("lwsDspslPrc", 0) or item.get("minBidPrice", 0)),
-                "auction_date": item.get("saleDtm") or item.get("auctionDate") or item.get("dxdyDt"),
-                "auction_count": int(item.get("slbdNo", 1) or item.get("bidCount", 1)),
-                "status": item.get("prcsSttsCd") or item.get("status"),
-            }
-            items.append(auction)
+        items = [_unpack_search_item(item) for item in result_list]
 
         return {
             "items": items,
@@ -612,7 +886,7 @@ class CourtAuctionCrawler:
 
     def _parse_html_result(self, html: str) -> Dict[str, Any]:
         """HTML 응답 파싱 (폴백)"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = _make_soup(html)
         items = []
 
         # 테이블 형식 파싱 시도
@@ -640,15 +914,14 @@ class CourtAuctionCrawler:
     def _get_sample_data(self, sgg_code: str = None) -> Dict[str, Any]:
         """샘플 데이터 반환 (개발용)"""
         # 구 이름 찾기
-        gu_name = "강남구"
-        for name, code in SEOUL_SGG_CODES.items():
-            if code == sgg_code:
-                gu_name = name
-                break
-
-        # 샘플 데이터
-        sample_items = [
-            {
+        gu_name = SEOUL_SGG_CODES_REVERSE.get(sgg_code, "강남구")
+
+        # 샘플 데이터 (위험도는 실제 파싱과 같은 기준으로 계산)
+        sample_items = []
+        for i in range(5):
+            auction_count = 1 + i % 3
+            risk_level, risk_reason = _risk_for_count(auction_count)
+            sample_items.append({
                 "id": f"2024타경{1000 + i}",
                 "court": "서울중앙지방법원",
                 "case_no": f"2024타경{1000 + i}",
@@ -658,14 +931,12 @@ class CourtAuctionCrawler:
                 "appraisal_price": 800000000 + i * 50000000,
                 "min_price": 640000000 + i * 40000000,
                 "auction_date": f"2025-02-{15 + i}",
-                "auction_count": 1 + i % 3,
+                "auction_count": auction_count,
                 "status": "진행",
-                "risk_level": "안전" if i % 2 == 0 else "주의",
-                "risk_reason": "" if i % 2 == 0 else f"{1 + i % 3}회 유찰",
+                "risk_level": risk_level,
+                "risk_reason": risk_reason,
                 "addr1": gu_name,
-            }
-            for i in range(5)
-        ]
+            })
 
         return {
             "items": sample_items,
@@ -675,70 +946,252 @@ class CourtAuctionCrawler:
         }
 
 
+atexit.register(CourtAuctionCrawler.close)
+
+
+class _CaseDetailError(Exception):
+    """사건 상세 조회 실패 (캐시하지 않도록 예외로 전달)"""
+
+
+# (법원코드, 사건번호, 탭) → (만료 시각, 상세 정보)
+_case_detail_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_case_detail_cache_lock = threading.Lock()
+
+
+# 여러 세션의 단건/일괄 조회가 겹쳐도 전체 동시 요청 수 제한
+_case_detail_semaphore = threading.BoundedSemaphore(CASE_DETAIL_MAX_CONCURRENCY)
+
+
+def _get_case_detail_cached(court_code: str, formatted_case_no: str, tab: str) -> Optional[Dict[str, Any]]:
+    """
+    사건 상세 조회 (정규화된 법원코드/사건번호/탭 기준 TTL 캐시)
+
+    결과가 없는 응답(None)은 캐시하지 않음.
+    반환된 딕셔너리는 캐시와 공유되므로 호출자가 수정하지 않아야 함
+    """
+    key = (court_code, formatted_case_no, tab)
+    with _case_detail_cache_lock:
+        entry = _case_detail_cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                _case_detail_cache.move_to_end(key)
+                return entry[1]
+            del _case_detail_cache[key]
+
+    data = _fetch_case_detail(court_code, formatted_case_no, tab)
+    if data is not None:
+        with _case_detail_cache_lock:
+            _case_detail_cache[key] = (time.monotonic() + CASE_DETAIL_CACHE_TTL, data)
+            _case_detail_cache.move_to_end(key)
+            while len(_case_detail_cache) > CASE_DETAIL_CACHE_SIZE:
+                _case_detail_cache.popitem(last=False)
+    return data
+
+
+def _fetch_case_detail(court_code: str, formatted_case_no: str, tab: str) -> Optional[Dict[str, Any]]:
+    """사건 상세 조회 API 호출 (실패 시 _CaseDetailError)"""
+    inner = {"cortOfcCd": court_code, "csNo": formatted_case_no}
+    inner.update(_EXTRA.get(tab, ()))
+    payload = {PAYLOAD_KEYS.get(tab, "dma_srchCsDtlInf"): inner}
+
+    with _case_detail_semaphore:
+        response = CourtAuctionCrawler._get_shared_session().post(
+            API_ENDPOINTS[tab],
+            json=payload,
+            timeout=30
+        )
+
+    if response.status_code != 200:
+        raise _CaseDetailError(f"API 요청 실패: {response.status_code}")
+
+    try:
+        data = _json_loads(response.content)
+    except ValueError:
+        raise _CaseDetailError("JSON 파싱 실패")
+
+    return data.get("data")
+
+
 # ============================================================
 # 편의 함수들
 # ============================================================
+class _RateLimiter:
+    """
+    토큰 버킷 방식 요청 속도 제한 (스레드 안전)
+
+    초당 rate개의 토큰이 채워지고, 최대 burst개까지 연속 요청 허용
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+_rate_limiter = _RateLimiter(REQUESTS_PER_SECOND, MAX_WORKERS)
+
+
+def _throttled_search(crawler: CourtAuctionCrawler, **kwargs) -> Dict[str, Any]:
+    """요청 속도 제한을 적용한 검색 래퍼 (스레드 워커용)"""
+    _rate_limiter.acquire()
+    return crawler.search_auctions(**kwargs)
+
+
+def _crawl_seoul_city_wide(
+    crawler: CourtAuctionCrawler,
+    target_gu: List[str],
+    max_pages: int,
+    max_workers: int
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    서울 전체(시군구 코드 없이) 페이지를 순서대로 조회 후 구별로 분류
+
+    max_workers 페이지씩 묶어 병렬 요청하고, 한 묶음의 데이터 행이 모두 없거나
+    (아파트 외 행만 있는 페이지는 계속 진행) API 응답이 아닌 페이지(샘플 데이터)를
+    만나면 그 앞 페이지까지만 사용
+
+    Returns:
+        구 목록 순서로 정렬된 경매 물건 리스트 (API가 서울 전체 검색을 거부하면 None)
+    """
+    grouped = {gu_name: [] for gu_name in target_gu}
+    page = 1
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while page <= max_pages:
+            batch = range(page, min(page + max_workers, max_pages + 1))
+            futures = [
+                executor.submit(
+                    _throttled_search, crawler, sido_code=SEOUL_SIDO_CODE, sgg_code=None, page=p
+                )
+                for p in batch
+            ]
+            results = [future.result() for future in futures]
+
+            # 첫 페이지부터 실패(샘플 데이터)면 구별 크롤링으로 전환
+            if page == 1 and results[0].get("source") != "courtauction_api":
+                return None
+
+            found = False
+            failed = False
+            for result in results:
+                # 중간 페이지 실패 시 샘플 데이터가 섞이지 않도록 그 페이지부터 중단
+                if result.get("source") != "courtauction_api":
+                    failed = True
+                    break
+                # 물건 종류 필터 전 행 수로 판단 (필터로 비어도 다음 페이지에 아파트가 있을 수 있음)
+                if result.get("row_count", 0):
+                    found = True
+                for item in result.get("items", []):
+                    if item.get("addr1") in grouped:
+                        grouped[item["addr1"]].append(item)
+
+            if failed or not found:
+                break
+            page = batch.stop
+
+    return [item for gu_name in target_gu for item in grouped[gu_name]]
+
+
 def crawl_seoul_auctions(
     gu_list: List[str] = None,
-    max_pages: int = 3
+    max_pages: int = 3,
+    max_workers: int = MAX_WORKERS,
+    city_wide: bool = False
 ) -> List[Dict[str, Any]]:
     """
-    서울 아파트 경매 물건 크롤링
+    서울 아파트 경매 물건 크롤링 (구 x 페이지 병렬 요청)
 
     Args:
         gu_list: 크롤링할 구 목록 (None이면 전체)
         max_pages: 구별 최대 페이지 수
+        max_workers: 동시 요청 수 (요청 속도는 REQUESTS_PER_SECOND로 별도 제한)
+        city_wide: True면 서울 전체 목록을 페이지 순으로 조회한 뒤 구별로 분류
+            (최대 max_pages x 구 개수 페이지, 실패 시 구별 크롤링으로 전환)
 
     Returns:
         경매 물건 리스트
     """
     crawler = CourtAuctionCrawler()
-    all_auctions = []
 
     target_gu = gu_list or list(SEOUL_SGG_CODES.keys())
 
-    for gu_name in target_gu:
-        sgg_code = SEOUL_SGG_CODES.get(gu_name)
-        if not sgg_code:
-            continue
-
-        print(f"[CRAWLER] {gu_name} 크롤링 중...")
-
-        for page in range(1, max_pages + 1):
-            result = crawler.search_auctions(
+    if city_wide:
+        logger.info("[CRAWLER] 서울 전체 목록 크롤링 중... (대상 %d개 구)", len(target_gu))
+        auctions = _crawl_seoul_city_wide(
+            crawler, target_gu, max_pages * len(target_gu), max_workers
+        )
+        if auctions is not None:
+            return auctions
+        logger.info("[CRAWLER] 서울 전체 검색 실패 - 구별 크롤링으로 전환")
+    jobs = [
+        (gu_name, page)
+        for gu_name in target_gu
+        if gu_name in SEOUL_SGG_CODES
+        for page in range(1, max_pages + 1)
+    ]
+
+    logger.info("[CRAWLER] 서울 %d개 구 / %d건 요청 병렬 크롤링 중...", len(target_gu), len(jobs))
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _throttled_search,
+                crawler,
                 sido_code=SEOUL_SIDO_CODE,
-                sgg_code=sgg_code,
+                sgg_code=SEOUL_SGG_CODES[gu_name],
                 page=page,
-            )
-
-            items = result.get("items", [])
-            if not items:
-                break
+            ): (gu_name, page)
+            for gu_name, page in jobs
+        }
 
+        for future, (gu_name, page) in futures.items():
+            items = future.result().get("items", [])
             for item in items:
-                # 위험도 계산
-                item["risk_level"] = calculate_risk_level(item)
-                item["risk_reason"] = get_risk_reason(item)
                 item["addr1"] = gu_name
+            results[(gu_name, page)] = items
 
+    # 구/페이지 순서 유지 (빈 페이지 이후는 제외)
+    all_auctions = []
+    for gu_name in target_gu:
+        for page in range(1, max_pages + 1):
+            items = results.get((gu_name, page))
+            if not items:
+                break
             all_auctions.extend(items)
 
-            # 요청 간 딜레이
-            time.sleep(1)
-
     return all_auctions
 
 
 def crawl_nationwide_auctions(
     court_list: List[str] = None,
-    property_type: str = "아파트"
+    property_type: str = "아파트",
+    max_workers: int = NATIONWIDE_MAX_WORKERS
 ) -> List[Dict[str, Any]]:
     """
-    전국 아파트 경매 물건 크롤링 (한경아 모드)
+    전국 아파트 경매 물건 크롤링 (한경아 모드, 법원별 병렬 요청)
 
     Args:
         court_list: 크롤링할 법원 목록 (None이면 전체)
         property_type: 물건 종류
+        max_workers: 동시 요청 수 (요청 속도는 REQUESTS_PER_SECOND로 별도 제한)
 
     Returns:
         경매 물건 리스트
@@ -747,50 +1200,54 @@ def crawl_nationwide_auctions(
     all_auctions = []
 
     target_courts = court_list or list(COURT_CODES.keys())
+    logger.info("[CRAWLER] %d개 법원 병렬 크롤링 중...", len(target_courts))
 
-    for court_name in target_courts:
-        print(f"[CRAWLER] {court_name} 크롤링 중...")
-
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # 각 법원별로 물건 검색
         # (실제 구현시 법원별 검색 API 사용)
-        result = crawler.search_auctions(property_type=property_type)
+        futures = [
+            (
+                court_name,
+                executor.submit(_throttled_search, crawler, property_type=property_type),
+            )
+            for court_name in target_courts
+        ]
 
-        items = result.get("items", [])
-        for item in items:
-            item["court"] = court_name
-            item["risk_level"] = calculate_risk_level(item)
-            item["risk_reason"] = get_risk_reason(item)
+        for court_name, future in futures:
+            items = future.result().get("items", [])
+            for item in items:
+                item["court"] = court_name
 
-        all_auctions.extend(items)
-        time.sleep(1)
+            all_auctions.extend(items)
 
     return all_auctions
 
 
-def calculate_risk_level(auction: Dict[str, Any]) -> str:
-    """위험도 계산"""
-    auction_count = auction.get("auction_count", 1)
+# 유찰 횟수별 위험도 (5회 이상은 마지막 값 사용)
+_RISK_LEVELS = ("안전", "안전", "안전", "주의", "주의", "위험")
+_LAST_RISK_INDEX = len(_RISK_LEVELS) - 1
 
-    # 3회 이상 유찰
-    if auction_count >= 3:
-        return "주의"
 
-    # 5회 이상 유찰
-    if auction_count >= 5:
-        return "위험"
+def _risk_for_count(auction_count: int) -> Tuple[str, str]:
+    """
+    유찰 횟수로 위험도/위험 사유 계산 (3회 이상 유찰: 주의, 5회 이상: 위험)
 
-    return "안전"
+    Returns:
+        (위험도, 위험 사유)
+    """
+    risk_level = _RISK_LEVELS[min(auction_count, _LAST_RISK_INDEX)]
+    risk_reason = f"{auction_count}회 유찰" if risk_level != "안전" else ""
+    return risk_level, risk_reason
 
 
-def get_risk_reason(auction: Dict[str, Any]) -> str:
-    """위험 사유 생성"""
-    reasons = []
-    auction_count = auction.get("auction_count", 1)
+def calculate_risk_level(auction: Dict[str, Any]) -> str:
+    """위험도 계산 (3회 이상 유찰: 주의, 5회 이상: 위험)"""
+    return _risk_for_count(auction.get("auction_count", 1))[0]
 
-    if auction_count >= 3:
-        reasons.append(f"{auction_count}회 유찰")
 
-    return ", ".join(reasons) if reasons else ""
+def get_risk_reason(auction: Dict[str, Any]) -> str:
+    """위험 사유 생성"""
+    return _risk_for_count(auction.get("auction_count", 1))[1]
 
 
 # ============================================================
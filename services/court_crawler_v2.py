@@ -5,17 +5,47 @@
 import os
 import json
 import time
+import threading
 import requests
-from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from services.logger import get_logger
+
+logger = get_logger("court_crawler_v2")
+
+# 빠른 JSON 인코딩/디코딩 (선택적 import)
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
+
 
 # ============================================================
 # 설정
 # ============================================================
 COURT_BASE_URL = "https://www.courtauction.go.kr"
 
+# 페이지 병렬 조회 시 동시 요청 수
+MAX_PAGE_WORKERS = 4
+
+# 페이지 요청 간 최소 간격 (초) - 병렬 조회 시 법원 서버 부하 제한
+PAGE_REQUEST_INTERVAL = 0.3
+
+# 세션 만료 시 재초기화 후 재시도 횟수
+SESSION_RETRY_ATTEMPTS = 3
+
+# 세션 만료(HTML 리다이렉트) 응답 표식
+_SESSION_EXPIRED = object()
+
 # API 엔드포인트
 API_ENDPOINTS = {
     "search": f"{COURT_BASE_URL}/pgj/pgjsearch/searchControllerMain.on",
@@ -53,6 +83,78 @@ USAGE_CODES = {
     "다세대": ["10103", "10104"],
 }
 
+# 물건 검색 페이로드 기본값 (호출마다 페이지/지역/법원/기일만 덮어씀)
+_SEARCH_PAYLOAD_TEMPLATE = {
+    "dma_pageInfo": {
+        "pageNo": 1,
+        "pageSize": 20,
+        "bfPageNo": "",
+        "startRowNo": "",
+        "totalCnt": "",
+        "totalYn": "Y",
+        "groupTotalCount": ""
+    },
+    "dma_srchGdsDtlSrchInfo": {
+        "rletDspslSpcCondCd": "",
+        "bidDvsCd": "000331",  # 기일입찰
+        "mvprpRletDvsCd": "00031R",  # 부동산
+        "cortAuctnSrchCondCd": "0004601",
+        "rprsAdongSdCd": "",
+        "rprsAdongSggCd": "",
+        "rprsAdongEmdCd": "",
+        "rdnmSdCd": "",
+        "rdnmSggCd": "",
+        "rdnmNo": "",
+        "mvprpDspslPlcAdongSdCd": "",
+        "mvprpDspslPlcAdongSggCd": "",
+        "mvprpDspslPlcAdongEmdCd": "",
+        "rdDspslPlcAdongSdCd": "",
+        "rdDspslPlcAdongSggCd": "",
+        "rdDspslPlcAdongEmdCd": "",
+        "cortOfcCd": "",
+        "jdbnCd": "",
+        "execrOfcDvsCd": "",
+        "lclDspslGdsLstUsgCd": "",
+        "mclDspslGdsLstUsgCd": "",
+        "sclDspslGdsLstUsgCd": "",
+        "cortAuctnMbrsId": "",
+        "aeeEvlAmtMin": "",
+        "aeeEvlAmtMax": "",
+        "lwsDspslPrcRateMin": "",
+        "lwsDspslPrcRateMax": "",
+        "flbdNcntMin": "",
+        "flbdNcntMax": "",
+        "objctArDtsMin": "",
+        "objctArDtsMax": "",
+        "mvprpArtclKndCd": "",
+        "mvprpArtclNm": "",
+        "mvprpAtchmPlcTypCd": "",
+        "notifyLoc": "off",
+        "lafjOrderBy": "",
+        "pgmId": "PGJ151F01",
+        "csNo": "",
+        "cortStDvs": "1",
+        "statNum": 1,
+        "bidBgngYmd": "",
+        "bidEndYmd": "",
+        "dspslDxdyYmd": "",
+        "fstDspslHm": "",
+        "scndDspslHm": "",
+        "thrdDspslHm": "",
+        "fothDspslHm": "",
+        "dspslPlcNm": "",
+        "lwsDspslPrcMin": "",
+        "lwsDspslPrcMax": "",
+        "grbxTypCd": "",
+        "gdsVendNm": "",
+        "fuelKndCd": "",
+        "carMdyrMax": "",
+        "carMdyrMin": "",
+        "carMdlNm": "",
+        "sideDvsCd": ""
+    }
+}
+
 
 # ============================================================
 # 크롤러 클래스
@@ -63,6 +165,17 @@ class CourtAuctionCrawlerV2:
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update(DEFAULT_HEADERS)
+        # 페이지 병렬 조회 시 연결 재사용 (keep-alive 풀)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+            ),
+        ))
         self._initialized = False
 
     def _init_session(self) -> bool:
@@ -83,16 +196,33 @@ class CourtAuctionCrawlerV2:
                     "sc-userid": "SYSTEM",
                 })
                 self._initialized = True
-                print("[CRAWLER] 세션 초기화 성공")
+                logger.debug("[CRAWLER] 세션 초기화 성공")
                 return True
             else:
-                print(f"[CRAWLER] 세션 초기화 실패: {response.status_code}")
+                logger.warning("[CRAWLER] 세션 초기화 실패: %s", response.status_code)
                 return False
 
         except Exception as e:
-            print(f"[CRAWLER] 세션 초기화 오류: {e}")
+            logger.error("[CRAWLER] 세션 초기화 오류: %s", e)
             return False
 
+    def _do_post(self, url: str, body: bytes):
+        """
+        API POST 요청
+
+        Args:
+            url: API 엔드포인트
+            body: 직렬화된 JSON 페이로드
+
+        Returns:
+            응답 객체, 세션 만료(HTML 리다이렉트) 시 _SESSION_EXPIRED
+        """
+        response = self.session.post(url, data=body, timeout=30)
+        # 본문 전체를 디코딩하지 않고 앞부분 바이트만 확인
+        if response.status_code == 200 and response.content[:64].lstrip().startswith(b"<!DOCTYPE"):
+            return _SESSION_EXPIRED
+        return response
+
     def search_auctions(
         self,
         court_code: str = "",
@@ -112,6 +242,7 @@ class CourtAuctionCrawlerV2:
             sido_code: 시도 코드 (예: "11" 서울)
             sgg_code: 시군구 코드
             usage_codes: 용도 코드 리스트 (아파트: ["10101", "10102"])
+                응답 페이지에서 걸러내므로 total은 용도 필터 전 건수
             bid_start_date: 입찰 시작일 (YYYYMMDD)
             bid_end_date: 입찰 종료일 (YYYYMMDD)
             page: 페이지 번호
@@ -130,110 +261,72 @@ class CourtAuctionCrawlerV2:
         if not bid_end_date:
             bid_end_date = (today + timedelta(days=14)).strftime("%Y%m%d")
 
-        # 페이로드 구성
+        # 페이로드 구성 (고정 필드는 템플릿 재사용)
         payload = {
             "dma_pageInfo": {
+                **_SEARCH_PAYLOAD_TEMPLATE["dma_pageInfo"],
                 "pageNo": page,
                 "pageSize": page_size,
-                "bfPageNo": "",
-                "startRowNo": "",
-                "totalCnt": "",
-                "totalYn": "Y",
-                "groupTotalCount": ""
             },
             "dma_srchGdsDtlSrchInfo": {
-                "rletDspslSpcCondCd": "",
-                "bidDvsCd": "000331",  # 기일입찰
-                "mvprpRletDvsCd": "00031R",  # 부동산
-                "cortAuctnSrchCondCd": "0004601",
+                **_SEARCH_PAYLOAD_TEMPLATE["dma_srchGdsDtlSrchInfo"],
                 "rprsAdongSdCd": sido_code,
                 "rprsAdongSggCd": sgg_code,
-                "rprsAdongEmdCd": "",
-                "rdnmSdCd": "",
-                "rdnmSggCd": "",
-                "rdnmNo": "",
-                "mvprpDspslPlcAdongSdCd": "",
-                "mvprpDspslPlcAdongSggCd": "",
-                "mvprpDspslPlcAdongEmdCd": "",
-                "rdDspslPlcAdongSdCd": "",
-                "rdDspslPlcAdongSggCd": "",
-                "rdDspslPlcAdongEmdCd": "",
                 "cortOfcCd": court_code,
-                "jdbnCd": "",
-                "execrOfcDvsCd": "",
-                "lclDspslGdsLstUsgCd": "",
-                "mclDspslGdsLstUsgCd": "",
-                "sclDspslGdsLstUsgCd": "",
-                "cortAuctnMbrsId": "",
-                "aeeEvlAmtMin": "",
-                "aeeEvlAmtMax": "",
-                "lwsDspslPrcRateMin": "",
-                "lwsDspslPrcRateMax": "",
-                "flbdNcntMin": "",
-                "flbdNcntMax": "",
-                "objctArDtsMin": "",
-                "objctArDtsMax": "",
-                "mvprpArtclKndCd": "",
-                "mvprpArtclNm": "",
-                "mvprpAtchmPlcTypCd": "",
-                "notifyLoc": "off",
-                "lafjOrderBy": "",
-                "pgmId": "PGJ151F01",
-                "csNo": "",
-                "cortStDvs": "1",
-                "statNum": 1,
                 "bidBgngYmd": bid_start_date,
                 "bidEndYmd": bid_end_date,
-                "dspslDxdyYmd": "",
-                "fstDspslHm": "",
-                "scndDspslHm": "",
-                "thrdDspslHm": "",
-                "fothDspslHm": "",
-                "dspslPlcNm": "",
-                "lwsDspslPrcMin": "",
-                "lwsDspslPrcMax": "",
-                "grbxTypCd": "",
-                "gdsVendNm": "",
-                "fuelKndCd": "",
-                "carMdyrMax": "",
-                "carMdyrMin": "",
-                "carMdlNm": "",
-                "sideDvsCd": ""
-            }
+            },
         }
 
+        result = self._search(payload, page, page_size)
+
+        # 용도 필터링 (요청 1회 후 응답 페이지에서 거름)
+        if usage_codes and "error" not in result:
+            result["items"] = [
+                item for item in result["items"]
+                if any(code in item.get("usage_code", "") for code in usage_codes)
+            ]
+
+        return result
+
+    def _search(self, payload: Dict[str, Any], page: int, page_size: int) -> Dict[str, Any]:
+        """
+        검색 API 호출 및 결과 파싱
+
+        Args:
+            payload: 검색 페이로드
+            page: 페이지 번호
+            page_size: 페이지 크기
+
+        Returns:
+            검색 결과 딕셔너리
+        """
         try:
-            response = self.session.post(
-                API_ENDPOINTS["search"],
-                json=payload,
-                timeout=30
-            )
+            body = _json_dumps(payload)
+
+            # 세션 만료(HTML 리다이렉트) 시 재초기화 후 같은 페이로드로 재시도
+            # (재초기화는 시도 사이에만, 마지막 시도 후에는 하지 않음)
+            for attempt in range(SESSION_RETRY_ATTEMPTS):
+                response = self._do_post(API_ENDPOINTS["search"], body)
+                if response is not _SESSION_EXPIRED:
+                    break
+                if attempt == SESSION_RETRY_ATTEMPTS - 1:
+                    return {"items": [], "total": 0, "error": "세션 만료 재시도 초과"}
+                logger.info("[CRAWLER] 세션 만료 - 재초기화")
+                self._initialized = False
+                if not self._init_session():
+                    return {"items": [], "total": 0, "error": "세션 초기화 실패"}
 
             if response.status_code == 200:
-                # HTML 리다이렉트 확인
-                if response.text.strip().startswith("<!DOCTYPE"):
-                    print("[CRAWLER] 세션 만료 - 재초기화")
-                    self._initialized = False
-                    return self.search_auctions(
-                        court_code, sido_code, sgg_code, usage_codes,
-                        bid_start_date, bid_end_date, page, page_size
-                    )
-
-                data = response.json()
+                data = _json_loads(response.content)
 
                 if "data" in data:
                     page_info = data["data"].get("dma_pageInfo", {})
                     raw_items = data["data"].get("dlt_srchResult", [])
 
                     # 아이템 파싱
-                    items = [self._parse_item(item) for item in raw_items]
-
-                    # 아파트 필터링
-                    if usage_codes:
-                        items = [
-                            item for item in items
-                            if any(code in item.get("usage_code", "") for code in usage_codes)
-                        ]
+                    parse_item = self._parse_item
+                    items = [parse_item(item) for item in raw_items]
 
                     return {
                         "items": items,
@@ -246,39 +339,40 @@ class CourtAuctionCrawlerV2:
             return {"items": [], "total": 0, "error": f"API 오류: {response.status_code}"}
 
         except Exception as e:
-            print(f"[CRAWLER] 검색 오류: {e}")
+            logger.error("[CRAWLER] 검색 오류: %s", e)
             return {"items": [], "total": 0, "error": str(e)}
 
     def _parse_item(self, raw: Dict) -> Dict[str, Any]:
         """원시 데이터를 표준 형식으로 파싱"""
+        get = raw.get
         return {
-            "id": raw.get("docid", ""),
-            "case_no": raw.get("srnSaNo", ""),
-            "court_code": raw.get("boCd", ""),
-            "court_name": raw.get("jiwonNm", ""),
-            "dept_name": raw.get("jpDeptNm", ""),
-            "address": raw.get("printSt", ""),
-            "sido": raw.get("hjguSido", ""),
-            "sigu": raw.get("hjguSigu", ""),
-            "dong": raw.get("hjguDong", ""),
-            "building_name": raw.get("buldNm", ""),
-            "building_detail": raw.get("buldList", ""),
-            "appraisal_price": int(raw.get("gamevalAmt", 0) or 0),
-            "min_price": int(raw.get("minmaePrice", 0) or 0),
-            "bid_count": int(raw.get("yuchalCnt", 0) or 0),
-            "auction_date": self._parse_date(raw.get("maeGiil", "")),
-            "auction_time": raw.get("maeHh1", ""),
-            "auction_place": raw.get("maePlace", ""),
-            "usage_name": raw.get("dspslUsgNm", ""),
-            "usage_code": raw.get("sclsUtilCd", ""),
-            "area_info": raw.get("pjbBuldList", ""),
-            "area_min": float(raw.get("minArea", 0) or 0),
-            "area_max": float(raw.get("maxArea", 0) or 0),
-            "status_code": raw.get("jinstatCd", ""),
-            "tel": raw.get("tel", ""),
-            "note": raw.get("mulBigo", ""),
-            "x_coord": raw.get("wgs84Xcordi", ""),
-            "y_coord": raw.get("wgs84Ycordi", ""),
+            "id": get("docid", ""),
+            "case_no": get("srnSaNo", ""),
+            "court_code": get("boCd", ""),
+            "court_name": get("jiwonNm", ""),
+            "dept_name": get("jpDeptNm", ""),
+            "address": get("printSt", ""),
+            "sido": get("hjguSido", ""),
+            "sigu": get("hjguSigu", ""),
+            "dong": get("hjguDong", ""),
+            "building_name": get("buldNm", ""),
+            "building_detail": get("buldList", ""),
+            "appraisal_price": int(get("gamevalAmt", 0) or 0),
+            "min_price": int(get("minmaePrice", 0) or 0),
+            "bid_count": int(get("yuchalCnt", 0) or 0),
+            "auction_date": self._parse_date(get("maeGiil", "")),
+            "auction_time": get("maeHh1", ""),
+            "auction_place": get("maePlace", ""),
+            "usage_name": get("dspslUsgNm", ""),
+            "usage_code": get("sclsUtilCd", ""),
+            "area_info": get("pjbBuldList", ""),
+            "area_min": float(get("minArea", 0) or 0),
+            "area_max": float(get("maxArea", 0) or 0),
+            "status_code": get("jinstatCd", ""),
+            "tel": get("tel", ""),
+            "note": get("mulBigo", ""),
+            "x_coord": get("wgs84Xcordi", ""),
+            "y_coord": get("wgs84Ycordi", ""),
         }
 
     def _parse_date(self, date_str: str) -> str:
@@ -312,16 +406,16 @@ class CourtAuctionCrawlerV2:
         try:
             response = self.session.post(
                 API_ENDPOINTS["case_detail"],
-                json=payload,
+                data=_json_dumps(payload),
                 timeout=30
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 return data.get("data")
 
         except Exception as e:
-            print(f"[CRAWLER] 상세조회 오류: {e}")
+            logger.error("[CRAWLER] 상세조회 오류: %s", e)
 
         return None
 
@@ -344,28 +438,43 @@ def search_seoul_apartments(
         경매 물건 리스트
     """
     crawler = CourtAuctionCrawlerV2()
-    all_items = []
-
-    for page in range(1, max_pages + 1):
-        print(f"[CRAWLER] 페이지 {page} 검색 중...")
+    throttle_lock = threading.Lock()
+    next_request_at = [0.0]
+
+    def fetch_page(page: int) -> Tuple[List[Dict[str, Any]], int]:
+        # 요청 시작 시각을 PAGE_REQUEST_INTERVAL 간격으로 배정
+        with throttle_lock:
+            now = time.monotonic()
+            start_at = max(now, next_request_at[0])
+            next_request_at[0] = start_at + PAGE_REQUEST_INTERVAL
+        if start_at > now:
+            time.sleep(start_at - now)
 
         result = crawler.search_auctions(
             sido_code="11",  # 서울
             page=page,
             page_size=page_size,
         )
-
-        items = result.get("items", [])
-        if not items:
-            break
-
-        all_items.extend(items)
-        print(f"  - {len(items)}건 추가 (총 {len(all_items)}건)")
-
-        if len(items) < page_size:
-            break
-
-        time.sleep(1)
+        return result.get("items", []), result.get("total", 0)
+
+    # 1페이지 조회 (세션 쿠키 획득 + 전체 건수 확인)
+    logger.info("[CRAWLER] 페이지 1 검색 중...")
+    first_items, total = fetch_page(1)
+    all_items = list(first_items)
+
+    # 나머지 페이지 병렬 조회 (전체 건수 기준으로 필요한 페이지만)
+    last_page = min(max_pages, -(-total // page_size)) if total else max_pages
+    if first_items and len(first_items) >= page_size and last_page > 1:
+        logger.info("[CRAWLER] 페이지 2~%d 병렬 검색 중...", last_page)
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            for items, _ in executor.map(fetch_page, range(2, last_page + 1)):
+                if not items:
+                    break
+                all_items.extend(items)
+                if len(items) < page_size:
+                    break
+
+    logger.info("[CRAWLER] 총 %d건 조회", len(all_items))
 
     # 아파트만 필터링
     apartment_items = [
@@ -373,7 +482,7 @@ def search_seoul_apartments(
         if "아파트" in item.get("usage_name", "") or "주상복합" in item.get("usage_name", "")
     ]
 
-    print(f"\n[CRAWLER] 총 {len(all_items)}건 중 아파트 {len(apartment_items)}건")
+    logger.info("[CRAWLER] 총 %d건 중 아파트 %d건", len(all_items), len(apartment_items))
     return apartment_items
 
 
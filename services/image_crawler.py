@@ -5,15 +5,49 @@
 """
 import os
 import re
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Optional
-from bs4 import BeautifulSoup
+import lxml.html
+
+from config import CACHE_DIR
+from services.logger import get_logger
+
+logger = get_logger("image_crawler")
 
 
 # 네이버 부동산 API (비공식)
 NAVER_LAND_SEARCH_URL = "https://m.land.naver.com/search/result/"
 NAVER_LAND_COMPLEX_URL = "https://m.land.naver.com/complex/info/"
 
+# 파싱용 정규식 (모듈 로드 시 1회 컴파일)
+_GU_DONG_RE = re.compile(r'([\w]+구)\s*([\w]+동)?')
+_COMPLEX_LINK_RE = re.compile(r'/complex/info/(\d+)')
+_IMAGE_TYPE_RE = re.compile(r'type=\w+')
+
+# 이미지 캐시 설정 (최대 항목 수 / 유효 시간(초) / 디스크 저장 경로)
+IMAGE_CACHE_MAXSIZE = 5000
+IMAGE_CACHE_TTL = 86400
+IMAGE_CACHE_PATH = os.path.join(CACHE_DIR, "images.sqlite")
+
+# 공유 HTTP 세션 (네이버 요청 간 keep-alive 연결 재사용)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+})
+
 # 샘플 이미지 (Unsplash)
 SAMPLE_APARTMENT_IMAGES = [
     "https://images.unsplash.com/photo-1545324418-cc1a3fa10c00?w=400",
@@ -22,6 +56,15 @@ SAMPLE_APARTMENT_IMAGES = [
     "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?w=400",
 ]
 
+# 시작 위치별 샘플 이미지 3개 조합 (미리 계산)
+_SAMPLE_IMAGE_ROTATIONS = tuple(
+    tuple(
+        SAMPLE_APARTMENT_IMAGES[(start + i) % len(SAMPLE_APARTMENT_IMAGES)]
+        for i in range(3)
+    )
+    for start in range(len(SAMPLE_APARTMENT_IMAGES))
+)
+
 
 def search_naver_complex(apt_name: str, address: str) -> Optional[str]:
     """
@@ -34,38 +77,31 @@ def search_naver_complex(apt_name: str, address: str) -> Optional[str]:
         search_query = apt_name
         if address:
             # 주소에서 구/동 추출
-            match = re.search(r'([\w]+구)\s*([\w]+동)?', address)
+            match = _GU_DONG_RE.search(address)
             if match:
                 search_query = f"{match.group(1)} {apt_name}"
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/json",
-        }
-
         # 네이버 부동산 검색 API
-        response = requests.get(
+        response = _SESSION.get(
             f"https://m.land.naver.com/search/result/{search_query}",
-            headers=headers,
+            headers={"Accept": "application/json"},
             timeout=10
         )
 
         if response.status_code == 200:
             # HTML에서 단지 정보 추출
-            soup = BeautifulSoup(response.text, 'html.parser')
+            root = lxml.html.fromstring(response.content)
 
-            # 단지 링크 찾기
-            complex_links = soup.find_all('a', href=re.compile(r'/complex/info/\d+'))
-            if complex_links:
-                href = complex_links[0].get('href', '')
-                match = re.search(r'/complex/info/(\d+)', href)
+            # 단지 링크 찾기 (첫 번째 단지 링크)
+            for link in root.iter('a'):
+                match = _COMPLEX_LINK_RE.search(link.get('href', ''))
                 if match:
                     return match.group(1)
 
         return None
 
     except Exception as e:
-        print(f"[IMAGE] 네이버 단지 검색 실패: {e}")
+        logger.warning("[IMAGE] 네이버 단지 검색 실패: %s", e)
         return None
 
 
@@ -79,28 +115,23 @@ def fetch_naver_images(complex_no: str, limit: int = 5) -> List[str]:
         return []
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        }
-
         # 단지 상세 페이지
-        response = requests.get(
+        response = _SESSION.get(
             f"https://m.land.naver.com/complex/info/{complex_no}",
-            headers=headers,
             timeout=10
         )
 
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            root = lxml.html.fromstring(response.content)
 
             # 이미지 태그 찾기
             images = []
-            for img in soup.find_all('img'):
+            for img in root.iter('img'):
                 src = img.get('src', '') or img.get('data-src', '')
                 if src and ('landthumb' in src or 'phinf.pstatic.net' in src):
                     # 고해상도 이미지로 변환
                     if 'type=' in src:
-                        src = re.sub(r'type=\w+', 'type=m', src)
+                        src = _IMAGE_TYPE_RE.sub('type=m', src)
                     images.append(src)
                     if len(images) >= limit:
                         break
@@ -110,7 +141,7 @@ def fetch_naver_images(complex_no: str, limit: int = 5) -> List[str]:
         return []
 
     except Exception as e:
-        print(f"[IMAGE] 네이버 이미지 조회 실패: {e}")
+        logger.warning("[IMAGE] 네이버 이미지 조회 실패: %s", e)
         return []
 
 
@@ -118,16 +149,16 @@ def get_auction_images(auction: Dict[str, Any]) -> List[str]:
     """
     경매 물건 이미지 조회
 
-    1. 네이버 부동산에서 검색
+    1. 네이버 부동산에서 검색 (단지 번호/단지 이미지는 캐시 재사용)
     2. 실패시 샘플 이미지 반환
     """
     apt_name = auction.get('apt_name', '')
     address = auction.get('address', '')
 
     # 네이버 부동산 검색 시도
-    complex_no = search_naver_complex(apt_name, address)
+    complex_no = _get_complex_no(apt_name, address)
     if complex_no:
-        images = fetch_naver_images(complex_no)
+        images = _get_complex_images(complex_no)
         if images:
             return images
 
@@ -137,17 +168,12 @@ def get_auction_images(auction: Dict[str, Any]) -> List[str]:
 
 def get_sample_images(auction: Dict[str, Any]) -> List[str]:
     """샘플 이미지 반환"""
-    # 해시 기반으로 일관된 이미지 선택
+    # 해시 기반으로 일관된 이미지 선택 (crc32: 실행마다 값이 바뀌지 않음)
     apt_name = auction.get('apt_name', 'default')
-    hash_val = hash(apt_name) % len(SAMPLE_APARTMENT_IMAGES)
+    hash_val = zlib.crc32(apt_name.encode('utf-8')) % len(SAMPLE_APARTMENT_IMAGES)
 
     # 2-3개 이미지 반환
-    images = []
-    for i in range(3):
-        idx = (hash_val + i) % len(SAMPLE_APARTMENT_IMAGES)
-        images.append(SAMPLE_APARTMENT_IMAGES[idx])
-
-    return images
+    return list(_SAMPLE_IMAGE_ROTATIONS[hash_val])
 
 
 def get_court_auction_images(case_no: str, court: str) -> List[str]:
@@ -161,25 +187,193 @@ def get_court_auction_images(case_no: str, court: str) -> List[str]:
     """
     # TODO: 법원 경매 사이트 API가 변경되어 구현 필요
     # 현재는 빈 리스트 반환
-    print(f"[IMAGE] 법원 경매 이미지 조회 (미구현): {court} {case_no}")
+    logger.debug("[IMAGE] 법원 경매 이미지 조회 (미구현): %s %s", court, case_no)
     return []
 
 
-# 이미지 캐시 (메모리)
-_image_cache: Dict[str, List[str]] = {}
+# ============================================================
+# 이미지 캐시 (LRU + TTL, 디스크 저장)
+# ============================================================
+
+class _TTLCache:
+    """
+    최대 크기(LRU)와 유효 시간(TTL)을 가진 스레드 안전 캐시
+
+    만료 시각은 time.time() 기준으로 저장하여 디스크에서 읽은 항목과 공유
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, stored_at: Optional[float] = None):
+        expires_at = (stored_at if stored_at is not None else time.time()) + self.ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+# auction_id → 이미지 (메모리)
+_image_cache = _TTLCache(IMAGE_CACHE_MAXSIZE, IMAGE_CACHE_TTL)
+# (apt_name, address) → complex_no
+_complex_no_cache = _TTLCache(IMAGE_CACHE_MAXSIZE, IMAGE_CACHE_TTL)
+# complex_no → 이미지 (같은 단지 물건끼리 공유)
+_complex_image_cache = _TTLCache(IMAGE_CACHE_MAXSIZE, IMAGE_CACHE_TTL)
+
+_disk_lock = threading.Lock()
+_disk_loaded = False
+
+# 디스크 테이블 kind 값
+_KIND_COMPLEX_NO = "complex_no"
+_KIND_COMPLEX_IMAGES = "complex_images"
+
+
+def _connect_disk_cache() -> sqlite3.Connection:
+    """디스크 캐시 연결 (테이블 없으면 생성)"""
+    os.makedirs(os.path.dirname(IMAGE_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(IMAGE_CACHE_PATH, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS image_cache ("
+        "kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+        "stored_at REAL NOT NULL, PRIMARY KEY (kind, key))"
+    )
+    return conn
+
+
+def _load_disk_cache():
+    """첫 접근 시 디스크 캐시를 메모리로 읽어옴 (만료 항목 제외)"""
+    global _disk_loaded
+    if _disk_loaded:
+        return
+
+    with _disk_lock:
+        if _disk_loaded:
+            return
+        _disk_loaded = True
+
+        try:
+            conn = _connect_disk_cache()
+            try:
+                cutoff = time.time() - IMAGE_CACHE_TTL
+                conn.execute("DELETE FROM image_cache WHERE stored_at <= ?", (cutoff,))
+                conn.commit()
+                rows = conn.execute(
+                    "SELECT kind, key, value, stored_at FROM image_cache ORDER BY stored_at"
+                ).fetchall()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("[IMAGE] 디스크 캐시 로드 실패: %s", e)
+            return
+
+        for kind, key, value, stored_at in rows:
+            if kind == _KIND_COMPLEX_NO:
+                _complex_no_cache.set(tuple(json.loads(key)), value, stored_at)
+            elif kind == _KIND_COMPLEX_IMAGES:
+                _complex_image_cache.set(key, json.loads(value), stored_at)
+
+
+def _save_disk_cache(kind: str, key: str, value: str):
+    """디스크 캐시에 항목 저장 (실패해도 메모리 캐시는 유지)"""
+    try:
+        with _disk_lock:
+            conn = _connect_disk_cache()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO image_cache (kind, key, value, stored_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (kind, key, value, time.time()),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("[IMAGE] 디스크 캐시 저장 실패: %s", e)
+
+
+def _get_complex_no(apt_name: str, address: str) -> Optional[str]:
+    """단지 번호 조회 (캐시 → 네이버 검색)"""
+    _load_disk_cache()
+
+    cache_key = (apt_name, address)
+    complex_no = _complex_no_cache.get(cache_key)
+    if complex_no is not None:
+        return complex_no
+
+    complex_no = search_naver_complex(apt_name, address)
+    if complex_no:
+        _complex_no_cache.set(cache_key, complex_no)
+        _save_disk_cache(
+            _KIND_COMPLEX_NO,
+            json.dumps(cache_key, ensure_ascii=False),
+            complex_no,
+        )
+    return complex_no
+
+
+def _get_complex_images(complex_no: str) -> List[str]:
+    """단지 이미지 조회 (캐시 → 네이버 단지 페이지)"""
+    _load_disk_cache()
+
+    images = _complex_image_cache.get(complex_no)
+    if images is not None:
+        return images
+
+    images = fetch_naver_images(complex_no)
+    if images:
+        _complex_image_cache.set(complex_no, images)
+        _save_disk_cache(_KIND_COMPLEX_IMAGES, complex_no, json.dumps(images))
+    return images
 
 
 def get_cached_images(auction_id: str, auction: Dict[str, Any]) -> List[str]:
     """캐시된 이미지 조회"""
-    if auction_id not in _image_cache:
-        _image_cache[auction_id] = get_auction_images(auction)
-    return _image_cache[auction_id]
+    images = _image_cache.get(auction_id)
+    if images is None:
+        images = get_auction_images(auction)
+        _image_cache.set(auction_id, images)
+    return images
 
 
 def clear_image_cache():
-    """이미지 캐시 초기화"""
-    global _image_cache
-    _image_cache = {}
+    """이미지 캐시 초기화 (메모리 + 디스크)"""
+    _image_cache.clear()
+    _complex_no_cache.clear()
+    _complex_image_cache.clear()
+
+    try:
+        with _disk_lock:
+            conn = _connect_disk_cache()
+            try:
+                conn.execute("DELETE FROM image_cache")
+                conn.commit()
+            finally:
+                conn.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("[IMAGE] 디스크 캐시 초기화 실패: %s", e)
 
 
 # 테스트
@@ -0,0 +1,51 @@
+"""
+동일 요청 중복 실행 방지
+- 같은 키로 동시에 들어온 호출은 먼저 시작된 호출의 결과를 공유
+- 결제 승인 / 카카오 토큰 발급 등 중복 호출 시 과금·멱등성 오류가 나는 API용
+"""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class InflightGroup:
+    """키별 진행 중 호출 공유 (완료되면 키 제거, 결과는 캐시하지 않음)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        키 단위로 fn 실행
+
+        Args:
+            key: 중복 판단 키
+            fn: 실행할 함수
+            *args, **kwargs: fn 인자
+
+        Returns:
+            fn 결과 (진행 중인 같은 키 호출이 있으면 그 결과)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._calls[key] = future
+
+        # 다른 스레드가 실행 중이면 결과 대기
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
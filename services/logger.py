@@ -0,0 +1,40 @@
+"""
+서경아 공통 로거
+- "seogyeonga" 로거 하위로 모듈별 로거 제공
+- 큐 기반 출력 (알림/결제 스레드에서 stdout 쓰기로 블로킹되지 않음)
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+
+# 공통 상위 로거 이름
+ROOT_LOGGER_NAME = "seogyeonga"
+
+_root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+
+if not _root_logger.handlers:
+    _root_logger.setLevel(logging.INFO)
+
+    _log_queue = queue.Queue(-1)
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    _root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _root_logger.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    모듈별 로거 조회
+
+    Args:
+        name: 모듈 이름 (예: "notification")
+
+    Returns:
+        "seogyeonga.<name>" 로거
+    """
+    return _root_logger.getChild(name)
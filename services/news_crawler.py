@@ -3,10 +3,48 @@
 """
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-from datetime import datetime
+import time
+import calendar
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import re
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from services.logger import get_logger
+
+logger = get_logger("news_crawler")
+
+# 빠른 JSON 인코딩/디코딩 (선택적 import)
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
+
+# HTML 태그 제거용 정규식
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# 피드 병렬 수집 시 동시 요청 수
+FEED_MAX_WORKERS = 8
+
+# published_ts(epoch 초) → published_at 변환 기준
+_EPOCH = datetime(1970, 1, 1)
+
+# 공유 HTTP 세션 (AI 요약 API 호출 간 keep-alive 연결 재사용)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 # 경매/부동산 관련 RSS 피드
 NEWS_FEEDS = {
@@ -42,93 +80,114 @@ REALESTATE_KEYWORDS = [
     "전세", "월세", "부동산", "주택", "토지"
 ]
 
+# 카테고리별 키워드 정규식 (우선순위 순, 모듈 로드 시 1회 컴파일)
+_CATEGORY_PATTERNS = [
+    ("경매", re.compile("|".join(map(re.escape, AUCTION_KEYWORDS)))),
+    ("재개발", re.compile("재건축|재개발")),
+    ("분양", re.compile("분양")),
+    ("부동산", re.compile("|".join(map(re.escape, REALESTATE_KEYWORDS)))),
+]
 
-def fetch_news(limit: int = 50) -> List[Dict[str, Any]]:
-    """뉴스 수집"""
-    all_news = []
+# 서울 자치구 (지역 추출용)
+SEOUL_DISTRICTS = [
+    "강남", "서초", "송파", "강동", "마포",
+    "영등포", "용산", "성동", "광진", "동작",
+    "관악", "금천", "구로", "양천", "강서",
+    "은평", "서대문", "종로", "중구", "성북",
+    "동대문", "중랑", "노원", "도봉", "강북"
+]
+
+# 자치구 정규식 (텍스트 1회 스캔으로 지역 추출)
+_REGION_RE = re.compile("|".join(map(re.escape, SEOUL_DISTRICTS)))
 
-    for source, url in NEWS_FEEDS.items():
-        try:
-            feed = feedparser.parse(url)
 
-            for entry in feed.entries[:limit]:
-                title = entry.get('title', '')
-                summary = entry.get('summary', entry.get('description', ''))
-                link = entry.get('link', '')
+def _parse_feed(source: str, url: str, limit: int) -> List[Dict[str, Any]]:
+    """RSS 피드 하나를 수집/파싱 (실패 시 빈 리스트)"""
+    news = []
 
-                # HTML 태그 제거
-                summary = re.sub(r'<[^>]+>', '', summary)[:300]
+    try:
+        feed = feedparser.parse(url)
 
-                # 발행일 파싱
-                published = entry.get('published_parsed') or entry.get('updated_parsed')
-                if published:
-                    published_at = datetime(*published[:6])
-                else:
-                    published_at = datetime.now()
+        for entry in feed.entries[:limit]:
+            title = entry.get('title', '')
+            summary = entry.get('summary', entry.get('description', ''))
+            link = entry.get('link', '')
 
-                # 카테고리 분류
-                category = classify_news(title + " " + summary)
+            # HTML 태그 제거 (300자만 쓰므로 앞부분만 처리)
+            summary = _HTML_TAG_RE.sub('', summary[:2000])[:300]
 
-                # 지역 추출
-                region = extract_region(title + " " + summary)
+            # 발행일 파싱 (정렬용 epoch 초)
+            published = entry.get('published_parsed') or entry.get('updated_parsed')
+            published_ts = _to_timestamp(published)
 
-                all_news.append({
-                    "title": title,
-                    "summary": summary,
-                    "source": source,
-                    "url": link,
-                    "published_at": published_at,
-                    "category": category,
-                    "region": region
-                })
+            # 카테고리 분류
+            category = classify_news(title + " " + summary)
 
-        except Exception as e:
-            print(f"[ERROR] {source} 뉴스 수집 실패: {e}")
+            # 지역 추출
+            region = extract_region(title + " " + summary)
 
-    # 최신순 정렬
-    all_news.sort(key=lambda x: x['published_at'], reverse=True)
+            news.append({
+                "title": title,
+                "summary": summary,
+                "source": source,
+                "url": link,
+                "published_ts": published_ts,
+                "category": category,
+                "region": region
+            })
 
-    return all_news[:limit]
+    except Exception as e:
+        logger.warning("[NEWS] %s 뉴스 수집 실패: %s", source, e)
 
+    return news
+
+
+def fetch_news(limit: int = 50) -> List[Dict[str, Any]]:
+    """뉴스 수집 (피드별 병렬 요청)"""
+    all_news = []
+
+    with ThreadPoolExecutor(max_workers=FEED_MAX_WORKERS) as executor:
+        results = executor.map(
+            lambda item: _parse_feed(item[0], item[1], limit),
+            NEWS_FEEDS.items()
+        )
+        for news in results:
+            all_news.extend(news)
+
+    # 최신순 정렬 (정수 비교), 남은 항목만 datetime 변환
+    all_news.sort(key=lambda x: x['published_ts'], reverse=True)
+
+    return _attach_published_at(all_news[:limit])
 
-def classify_news(text: str) -> str:
-    """뉴스 카테고리 분류"""
-    text = text.lower()
 
-    # 경매 관련
-    for keyword in AUCTION_KEYWORDS:
-        if keyword in text:
-            return "경매"
+def _to_timestamp(published: Optional[time.struct_time]) -> int:
+    """발행일 struct_time → epoch 초 (없으면 현재 시각)"""
+    return calendar.timegm(published or time.localtime())
 
-    # 재건축/재개발
-    if "재건축" in text or "재개발" in text:
-        return "재개발"
 
-    # 분양
-    if "분양" in text:
-        return "분양"
+def _attach_published_at(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """published_ts 기준으로 표시용 published_at(datetime) 채우기"""
+    for item in items:
+        item['published_at'] = _EPOCH + timedelta(seconds=item['published_ts'])
+    return items
 
-    # 기타 부동산
-    for keyword in REALESTATE_KEYWORDS:
-        if keyword in text:
-            return "부동산"
+
+def classify_news(text: str) -> str:
+    """뉴스 카테고리 분류 (경매 > 재개발 > 분양 > 부동산 우선순위)"""
+    text = text.lower()
+
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(text):
+            return category
 
     return "기타"
 
 
 def extract_region(text: str) -> str:
-    """텍스트에서 지역 추출"""
-    seoul_districts = [
-        "강남", "서초", "송파", "강동", "마포",
-        "영등포", "용산", "성동", "광진", "동작",
-        "관악", "금천", "구로", "양천", "강서",
-        "은평", "서대문", "종로", "중구", "성북",
-        "동대문", "중랑", "노원", "도봉", "강북"
-    ]
-
-    for district in seoul_districts:
-        if district in text:
-            return f"{district}구"
+    """텍스트에서 지역 추출 (가장 먼저 언급된 자치구)"""
+    match = _REGION_RE.search(text)
+    if match:
+        return f"{match.group()}구"
 
     if "서울" in text:
         return "서울"
@@ -161,42 +220,51 @@ def format_time_ago(dt: datetime) -> str:
 # 유튜브 크롤링
 # ================================
 
+def _parse_youtube_channel(channel_name: str, channel_id: str) -> List[Dict[str, Any]]:
+    """유튜브 채널 RSS 하나를 수집/파싱 (실패 시 빈 리스트)"""
+    videos = []
+
+    try:
+        rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+        feed = feedparser.parse(rss_url)
+
+        for entry in feed.entries[:5]:
+            video_id = entry.get('yt_videoid', '')
+            title = entry.get('title', '')
+            published_ts = _to_timestamp(entry.get('published_parsed'))
+
+            videos.append({
+                "title": title,
+                "video_id": video_id,
+                "channel": channel_name,
+                "url": f"https://www.youtube.com/watch?v={video_id}",
+                "thumbnail": f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg",
+                "published_ts": published_ts,
+                "category": "유튜브",
+                "summary": "",  # AI로 채울 예정
+            })
+    except Exception as e:
+        logger.warning("[NEWS] %s 유튜브 수집 실패: %s", channel_name, e)
+
+    return videos
+
+
 def fetch_youtube_videos(limit: int = 20) -> List[Dict[str, Any]]:
-    """유튜브 영상 수집 (RSS 기반)"""
+    """유튜브 영상 수집 (RSS 기반, 채널별 병렬 요청)"""
     videos = []
 
     # 채널 RSS에서 최신 영상 가져오기
-    for channel_name, channel_id in YOUTUBE_CHANNELS.items():
-        try:
-            rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-            feed = feedparser.parse(rss_url)
-
-            for entry in feed.entries[:5]:
-                video_id = entry.get('yt_videoid', '')
-                title = entry.get('title', '')
-                published = entry.get('published_parsed')
-
-                if published:
-                    published_at = datetime(*published[:6])
-                else:
-                    published_at = datetime.now()
-
-                videos.append({
-                    "title": title,
-                    "video_id": video_id,
-                    "channel": channel_name,
-                    "url": f"https://www.youtube.com/watch?v={video_id}",
-                    "thumbnail": f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg",
-                    "published_at": published_at,
-                    "category": "유튜브",
-                    "summary": "",  # AI로 채울 예정
-                })
-        except Exception as e:
-            print(f"[ERROR] {channel_name} 유튜브 수집 실패: {e}")
-
-    # 최신순 정렬
-    videos.sort(key=lambda x: x['published_at'], reverse=True)
-    return videos[:limit]
+    with ThreadPoolExecutor(max_workers=FEED_MAX_WORKERS) as executor:
+        results = executor.map(
+            lambda item: _parse_youtube_channel(*item),
+            YOUTUBE_CHANNELS.items()
+        )
+        for channel_videos in results:
+            videos.extend(channel_videos)
+
+    # 최신순 정렬 (정수 비교), 남은 항목만 datetime 변환
+    videos.sort(key=lambda x: x['published_ts'], reverse=True)
+    return _attach_published_at(videos[:limit])
 
 
 def get_sample_youtube_videos() -> List[Dict[str, Any]]:
@@ -242,6 +310,9 @@ def get_sample_youtube_videos() -> List[Dict[str, Any]]:
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY", "")
 
+# 여러 콘텐츠 요약 시 동시 요청 수 (Ollama 동시 처리 한도에 맞춤)
+SUMMARY_MAX_WORKERS = 4
+
 SUMMARY_PROMPT = """다음 뉴스/콘텐츠를 경매 투자자 관점에서 2-3문장으로 요약해주세요.
 핵심 정보와 투자 시사점을 포함해주세요.
 
@@ -255,19 +326,20 @@ def summarize_with_ollama(title: str, content: str) -> str:
     """Ollama로 요약 (로컬 무료)"""
     try:
         prompt = SUMMARY_PROMPT.format(title=title, content=content[:1000])
-        response = requests.post(
+        response = _SESSION.post(
             f"{OLLAMA_HOST}/api/generate",
-            json={
+            headers={"Content-Type": "application/json"},
+            data=_json_dumps({
                 "model": "llama3.2",
                 "prompt": prompt,
                 "stream": False
-            },
+            }),
             timeout=30
         )
         if response.status_code == 200:
-            return response.json().get("response", "").strip()
+            return _json_loads(response.content).get("response", "").strip()
     except Exception as e:
-        print(f"[ERROR] Ollama 요약 실패: {e}")
+        logger.warning("[NEWS] Ollama 요약 실패: %s", e)
     return ""
 
 
@@ -278,23 +350,23 @@ def summarize_with_deepseek(title: str, content: str) -> str:
 
     try:
         prompt = SUMMARY_PROMPT.format(title=title, content=content[:1000])
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.deepseek.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {DEEPSEEK_API_KEY}",
                 "Content-Type": "application/json"
             },
-            json={
+            data=_json_dumps({
                 "model": "deepseek-chat",
                 "messages": [{"role": "user", "content": prompt}],
                 "max_tokens": 200
-            },
+            }),
             timeout=30
         )
         if response.status_code == 200:
-            return response.json()["choices"][0]["message"]["content"].strip()
+            return _json_loads(response.content)["choices"][0]["message"]["content"].strip()
     except Exception as e:
-        print(f"[ERROR] DeepSeek 요약 실패: {e}")
+        logger.warning("[NEWS] DeepSeek 요약 실패: %s", e)
     return ""
 
 
@@ -313,16 +385,44 @@ def summarize_content(title: str, content: str, provider: str = "auto") -> str:
     return ""
 
 
+def summarize_batch(
+    items: List[Dict[str, Any]],
+    provider: str = "auto",
+    max_workers: int = SUMMARY_MAX_WORKERS
+) -> List[str]:
+    """
+    여러 콘텐츠 동시 AI 요약
+
+    Args:
+        items: title/summary 키를 가진 콘텐츠 리스트
+        provider: 요약 제공자 (auto/ollama/deepseek)
+        max_workers: 동시 요청 수
+
+    Returns:
+        입력 순서대로 요약 결과 리스트 (실패 시 빈 문자열)
+    """
+    if not items:
+        return []
+
+    def summarize_item(item: Dict[str, Any]) -> str:
+        return summarize_content(item.get('title', ''), item.get('summary', ''), provider)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(summarize_item, items))
+
+
 def fetch_news_with_summary(limit: int = 20, summarize: bool = False) -> List[Dict[str, Any]]:
     """뉴스 수집 + AI 요약"""
     news_list = fetch_news(limit)
 
     if summarize:
-        for news in news_list:
-            if not news.get('summary') or len(news['summary']) < 50:
-                ai_summary = summarize_content(news['title'], news.get('summary', ''))
-                if ai_summary:
-                    news['ai_summary'] = ai_summary
+        targets = [
+            news for news in news_list
+            if not news.get('summary') or len(news['summary']) < 50
+        ]
+        for news, ai_summary in zip(targets, summarize_batch(targets)):
+            if ai_summary:
+                news['ai_summary'] = ai_summary
 
     return news_list
 
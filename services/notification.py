@@ -4,16 +4,74 @@
 - 이메일 알림 (Resend)
 """
 import os
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import Dict, Any, List, Optional
 
+from services.inflight import InflightGroup
+from services.logger import get_logger
+
+logger = get_logger("notification")
+
+# 빠른 JSON 인코딩/디코딩 (선택적 import)
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
+
 
 # 환경변수
 KAKAO_REST_API_KEY = os.getenv("KAKAO_REST_API_KEY", "")
 KAKAO_REDIRECT_URI = os.getenv("KAKAO_REDIRECT_URI", "http://localhost:8502/callback")
 RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")
 
+# 같은 인증 코드로 토큰 발급이 동시에 중복 호출되면 1회만 요청
+_TOKEN_INFLIGHT = InflightGroup()
+
+# 알림 동시 발송 수 (카카오/Resend 호출 한도 고려)
+REMINDER_MAX_WORKERS = 8
+
+# 입찰일 알림 시점 (D-N)
+REMINDER_DAYS = (3, 1)
+
+# 카카오 API 공유 세션 (keep-alive 연결 재사용)
+# 발송 스레드 수만큼만 연결을 유지하고, 초과 시 새 연결 대신 반납을 기다림
+_KAKAO_SESSION = requests.Session()
+_KAKAO_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=REMINDER_MAX_WORKERS,
+    pool_block=True,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
+
+
+# ================================
+# 메시지 포맷
+# ================================
+
+def format_min_price(min_price: int) -> str:
+    """최저가 포맷 (예: 5억, 9,500만)"""
+    if min_price >= 100000000:
+        return f"{min_price // 100000000}억"
+    return f"{min_price // 10000:,}만"
+
+
+def _urgency_label(days_until: int) -> str:
+    """남은 일수에 따른 긴급도 표시"""
+    if days_until <= 1:
+        return "🚨 [긴급]"
+    if days_until <= 3:
+        return "⚠️ [알림]"
+    return "📢 [안내]"
+
 
 # ================================
 # 카카오톡 알림
@@ -22,71 +80,94 @@ RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")
 class KakaoNotifier:
     """카카오톡 알림 서비스"""
 
+    DEFAULT_URL = "https://www.courtauction.go.kr"
+
+    # 텍스트 메시지 템플릿 기본값 (발송마다 복사 후 text/link만 교체)
+    _TEMPLATE_SKELETON = {
+        "object_type": "text",
+        "text": "",
+        "link": {
+            "web_url": DEFAULT_URL,
+            "mobile_web_url": DEFAULT_URL,
+        },
+        "button_title": "자세히 보기",
+    }
+
     def __init__(self, access_token: str = None):
         self.access_token = access_token
         self.api_url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
 
+    @property
+    def access_token(self) -> Optional[str]:
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, token: Optional[str]):
+        """토큰 변경 시 요청 헤더도 함께 갱신"""
+        self._access_token = token
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+
     def send_message(self, message: Dict) -> bool:
         """카카오톡 메시지 발송"""
         if not self.access_token:
-            print("[KAKAO] Access token이 없습니다.")
+            logger.warning("[KAKAO] Access token이 없습니다.")
             return False
 
         try:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/x-www-form-urlencoded"
-            }
-
             # 텍스트 메시지 템플릿
-            template = {
-                "object_type": "text",
-                "text": message.get("text", ""),
-                "link": {
-                    "web_url": message.get("url", "https://www.courtauction.go.kr"),
-                    "mobile_web_url": message.get("url", "https://www.courtauction.go.kr"),
-                },
-                "button_title": message.get("button", "자세히 보기")
-            }
-
-            import json
-            response = requests.post(
+            template = self._TEMPLATE_SKELETON.copy()
+            template["text"] = message.get("text", "")
+            url = message.get("url")
+            if url:
+                template["link"] = {"web_url": url, "mobile_web_url": url}
+            button = message.get("button")
+            if button:
+                template["button_title"] = button
+
+            response = _KAKAO_SESSION.post(
                 self.api_url,
-                headers=headers,
-                data={"template_object": json.dumps(template)},
+                headers=self._headers,
+                data={"template_object": _json_dumps(template).decode("utf-8")},
                 timeout=10
             )
 
             if response.status_code == 200:
-                print(f"[KAKAO] 메시지 발송 성공")
+                logger.info("[KAKAO] 메시지 발송 성공")
                 return True
             else:
-                print(f"[KAKAO] 발송 실패: {response.status_code} - {response.text}")
+                logger.warning("[KAKAO] 발송 실패: %s - %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            print(f"[KAKAO] 오류: {e}")
+            logger.error("[KAKAO] 오류: %s", e)
             return False
 
-    def send_auction_reminder(self, auction: Dict[str, Any], days_until: int) -> bool:
-        """경매 입찰일 알림"""
+    def send_auction_reminder(
+        self,
+        auction: Dict[str, Any],
+        days_until: int,
+        price_str: str = None
+    ) -> bool:
+        """
+        경매 입찰일 알림
+
+        Args:
+            auction: 경매 물건
+            days_until: 입찰일까지 남은 일수
+            price_str: 미리 포맷한 최저가 (없으면 계산)
+        """
         apt_name = auction.get('apt_name', '아파트')
-        min_price = auction.get('min_price', 0)
         auction_date = auction.get('auction_date', '')
 
         # 가격 포맷
-        if min_price >= 100000000:
-            price_str = f"{min_price // 100000000}억"
-        else:
-            price_str = f"{min_price // 10000:,}만"
+        if price_str is None:
+            price_str = format_min_price(auction.get('min_price', 0))
 
         # 긴급도에 따른 메시지
-        if days_until <= 1:
-            urgency = "🚨 [긴급]"
-        elif days_until <= 3:
-            urgency = "⚠️ [알림]"
-        else:
-            urgency = "📢 [안내]"
+        urgency = _urgency_label(days_until)
 
         message_text = f"""{urgency} 입찰일 D-{days_until}
 
@@ -122,8 +203,13 @@ def get_kakao_token(auth_code: str) -> Optional[str]:
     if not KAKAO_REST_API_KEY:
         return None
 
+    return _TOKEN_INFLIGHT.do(auth_code, _request_kakao_token, auth_code)
+
+
+def _request_kakao_token(auth_code: str) -> Optional[str]:
+    """카카오 토큰 발급 API 호출"""
     try:
-        response = requests.post(
+        response = _KAKAO_SESSION.post(
             "https://kauth.kakao.com/oauth/token",
             data={
                 "grant_type": "authorization_code",
@@ -135,13 +221,13 @@ def get_kakao_token(auth_code: str) -> Optional[str]:
         )
 
         if response.status_code == 200:
-            return response.json().get("access_token")
+            return _json_loads(response.content).get("access_token")
         else:
-            print(f"[KAKAO] 토큰 발급 실패: {response.text}")
+            logger.warning("[KAKAO] 토큰 발급 실패: %s", response.text)
             return None
 
     except Exception as e:
-        print(f"[KAKAO] 토큰 오류: {e}")
+        logger.error("[KAKAO] 토큰 오류: %s", e)
         return None
 
 
@@ -149,27 +235,37 @@ def get_kakao_token(auth_code: str) -> Optional[str]:
 # 이메일 알림 (Resend)
 # ================================
 
-def send_auction_reminder(user_email: str, auction: Dict[str, Any], days_until: int) -> bool:
-    """입찰일 알림 발송 (이메일)"""
+def send_auction_reminder(
+    user_email: str,
+    auction: Dict[str, Any],
+    days_until: int,
+    price_str: str = None
+) -> bool:
+    """
+    입찰일 알림 발송 (이메일)
 
+    Args:
+        user_email: 수신 이메일
+        auction: 경매 물건
+        days_until: 입찰일까지 남은 일수
+        price_str: 미리 포맷한 최저가 (없으면 계산)
+    """
     apt_name = auction.get('apt_name', '아파트')
     address = auction.get('address', '')
-    min_price = auction.get('min_price', 0)
     auction_date = auction.get('auction_date', '')
 
     # 가격 포맷
-    if min_price >= 100000000:
-        price_str = f"{min_price // 100000000}억원"
-    else:
-        price_str = f"{min_price // 10000:,}만원"
+    if price_str is None:
+        price_str = format_min_price(auction.get('min_price', 0))
+    price_str += "원"
 
     subject = f"[서경아] {apt_name} 입찰일 D-{days_until}"
 
     if not RESEND_API_KEY:
-        print(f"[EMAIL] 알림 발송 (미구현)")
-        print(f"  To: {user_email}")
-        print(f"  제목: {subject}")
-        print(f"  내용: {apt_name} / {price_str} / {auction_date}")
+        logger.info(
+            "[EMAIL] 알림 발송 (미구현)\n  To: %s\n  제목: %s\n  내용: %s / %s / %s",
+            user_email, subject, apt_name, price_str, auction_date
+        )
         return False
 
     try:
@@ -211,7 +307,7 @@ def send_auction_reminder(user_email: str, auction: Dict[str, Any], days_until:
         return True
 
     except Exception as e:
-        print(f"[EMAIL] 발송 오류: {e}")
+        logger.error("[EMAIL] 발송 오류: %s", e)
         return False
 
 
@@ -219,8 +315,7 @@ def send_welcome_email(user_email: str, nickname: str = None) -> bool:
     """가입 환영 이메일"""
 
     if not RESEND_API_KEY:
-        print(f"[EMAIL] 환영 이메일 (미구현)")
-        print(f"  To: {user_email}")
+        logger.info("[EMAIL] 환영 이메일 (미구현)\n  To: %s", user_email)
         return False
 
     return False
@@ -230,6 +325,20 @@ def send_welcome_email(user_email: str, nickname: str = None) -> bool:
 # 알림 스케줄러
 # ================================
 
+def _parse_auction_date(value: str) -> Optional[date]:
+    """입찰일 문자열(YYYY-MM-DD) 파싱 (실패 시 None)"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+
+    # 자리수가 맞지 않는 형식 (예: 2024-2-5)
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
 def check_and_send_reminders(favorites: List[Dict[str, Any]], user_tokens: Dict[str, str] = None):
     """
     관심 물건 입찰일 체크 및 알림 발송
@@ -239,35 +348,49 @@ def check_and_send_reminders(favorites: List[Dict[str, Any]], user_tokens: Dict[
     """
     today = date.today()
     user_tokens = user_tokens or {}
+    email = user_tokens.get('email')
+    notifier = KakaoNotifier(user_tokens['kakao_token']) if user_tokens.get('kakao_token') else None
 
+    # D-3 / D-1 대상 물건을 한 번에 분류
+    due: Dict[int, List[Dict[str, Any]]] = {days: [] for days in REMINDER_DAYS}
     for auction in favorites:
-        auction_date_str = auction.get('auction_date')
-        if not auction_date_str:
+        auction_date = auction.get('auction_date')
+        if not auction_date:
             continue
 
-        try:
-            if isinstance(auction_date_str, str):
-                auction_date = datetime.strptime(auction_date_str, "%Y-%m-%d").date()
-            else:
-                auction_date = auction_date_str
-        except:
-            continue
+        if isinstance(auction_date, str):
+            auction_date = _parse_auction_date(auction_date)
+            if auction_date is None:
+                continue
 
-        days_until = (auction_date - today).days
+        bucket = due.get((auction_date - today).days)
+        if bucket is not None:
+            bucket.append(auction)
 
-        # D-3 또는 D-1 알림
-        if days_until in [3, 1]:
+    # 발송 작업 수집 후 병렬 실행
+    jobs = []
+    for days_until, auctions in due.items():
+        for auction in auctions:
             apt_name = auction.get('apt_name', '아파트')
-            print(f"[REMINDER] {apt_name} - D-{days_until}")
+            logger.info("[REMINDER] %s - D-%s", apt_name, days_until)
+
+            # 가격 포맷은 물건당 1회 (이메일/카카오 공유)
+            price_str = format_min_price(auction.get('min_price', 0))
 
             # 이메일 알림
-            if user_tokens.get('email'):
-                send_auction_reminder(user_tokens['email'], auction, days_until)
+            if email:
+                jobs.append((send_auction_reminder, email, auction, days_until, price_str))
 
             # 카카오톡 알림
-            if user_tokens.get('kakao_token'):
-                notifier = KakaoNotifier(user_tokens['kakao_token'])
-                notifier.send_auction_reminder(auction, days_until)
+            if notifier:
+                jobs.append((notifier.send_auction_reminder, auction, days_until, price_str))
+
+    if not jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(REMINDER_MAX_WORKERS, len(jobs))) as executor:
+        for job in jobs:
+            executor.submit(*job)
 
 
 # 테스트
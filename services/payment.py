@@ -9,14 +9,33 @@
 """
 
 import os
+import json
+import time
+import itertools
 import base64
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hashlib
 import hmac
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+from services.inflight import InflightGroup
+
+# 빠른 JSON 인코딩/디코딩 (선택적 import)
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
+
 load_dotenv()
 
 # ================================
@@ -38,12 +57,25 @@ if TOSS_TEST_MODE and not TOSS_CLIENT_KEY:
     TOSS_CLIENT_KEY = "test_ck_D5GePWvyJnrK0W0k6q8gLzN97Eoq"
     TOSS_SECRET_KEY = "test_sk_zXLkKEypNArWmo50nX3lmeaxYG5R"
 
+# 같은 주문의 승인/빌링 결제가 동시에 중복 호출되면 1회만 요청
+_PAYMENT_INFLIGHT = InflightGroup()
+
+# 토스 API 공유 세션 (keep-alive 연결 재사용, POST는 재시도하지 않음)
+# 연결 수 상한을 넘으면 새 연결 대신 반납을 기다림
+_TOSS_SESSION = requests.Session()
+_TOSS_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    pool_block=True,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
+
 
 # ================================
 # 가격 플랜
 # ================================
 
-PRICE_PLANS = {
+PRICE_PLANS = MappingProxyType({
     "basic_monthly": {
         "id": "basic_monthly",
         "name": "Basic 월간",
@@ -110,24 +142,47 @@ PRICE_PLANS = {
         ],
         "analysis_limit": 1,
     },
+})
+
+# 결제 주기별 구독 기간
+_PERIOD_DELTAS = {
+    "monthly": timedelta(days=30),
+    "yearly": timedelta(days=365),
 }
 
+# 플랜별 구독 기간 (모듈 로드 시 1회 계산, 단건/미정의 플랜은 0일)
+_NO_DELTA = timedelta(0)
+_PLAN_DELTAS = MappingProxyType({
+    plan_id: _PERIOD_DELTAS.get(plan["period"], _NO_DELTA)
+    for plan_id, plan in PRICE_PLANS.items()
+})
+
 
 # ================================
 # 토스페이먼츠 API
 # ================================
 
-def get_auth_header() -> Dict[str, str]:
-    """토스페이먼츠 인증 헤더 생성"""
+@lru_cache(maxsize=4)
+def _build_auth_header(secret_key: str) -> Dict[str, str]:
+    """시크릿 키별 인증 헤더 (키가 바뀌면 새로 생성)"""
     # Base64 인코딩: secretKey:
-    auth_string = f"{TOSS_SECRET_KEY}:"
-    encoded = base64.b64encode(auth_string.encode()).decode()
+    encoded = base64.b64encode(f"{secret_key}:".encode()).decode()
     return {
         "Authorization": f"Basic {encoded}",
         "Content-Type": "application/json",
     }
 
 
+def get_auth_header() -> Dict[str, str]:
+    """
+    토스페이먼츠 인증 헤더 조회
+
+    Returns:
+        캐시된 헤더 딕셔너리 (공유 객체이므로 수정하지 말 것)
+    """
+    return _build_auth_header(TOSS_SECRET_KEY)
+
+
 def create_payment(
     order_id: str,
     amount: int,
@@ -167,8 +222,16 @@ def confirm_payment(payment_key: str, order_id: str, amount: int) -> Tuple[bool,
     Returns:
         (성공 여부, 응답 데이터)
     """
+    return _PAYMENT_INFLIGHT.do(
+        ("confirm", payment_key, order_id, amount),
+        _confirm_payment, payment_key, order_id, amount,
+    )
+
+
+def _confirm_payment(payment_key: str, order_id: str, amount: int) -> Tuple[bool, Dict]:
+    """결제 승인 API 호출"""
     try:
-        response = requests.post(
+        response = _TOSS_SESSION.post(
             f"{TOSS_API_URL}/payments/confirm",
             headers=get_auth_header(),
             json={
@@ -179,7 +242,7 @@ def confirm_payment(payment_key: str, order_id: str, amount: int) -> Tuple[bool,
             timeout=30,
         )
 
-        data = response.json()
+        data = _json_loads(response.content)
 
         if response.status_code == 200:
             return True, data
@@ -193,13 +256,13 @@ def confirm_payment(payment_key: str, order_id: str, amount: int) -> Tuple[bool,
 def get_payment(payment_key: str) -> Tuple[bool, Dict]:
     """결제 정보 조회"""
     try:
-        response = requests.get(
+        response = _TOSS_SESSION.get(
             f"{TOSS_API_URL}/payments/{payment_key}",
             headers=get_auth_header(),
             timeout=30,
         )
 
-        data = response.json()
+        data = _json_loads(response.content)
         return response.status_code == 200, data
 
     except Exception as e:
@@ -217,14 +280,14 @@ def cancel_payment(
         if cancel_amount:
             payload["cancelAmount"] = cancel_amount
 
-        response = requests.post(
+        response = _TOSS_SESSION.post(
             f"{TOSS_API_URL}/payments/{payment_key}/cancel",
             headers=get_auth_header(),
             json=payload,
             timeout=30,
         )
 
-        data = response.json()
+        data = _json_loads(response.content)
         return response.status_code == 200, data
 
     except Exception as e:
@@ -245,7 +308,7 @@ def create_billing_key(
     카드 정보 등록 후 빌링키 발급
     """
     try:
-        response = requests.post(
+        response = _TOSS_SESSION.post(
             f"{TOSS_API_URL}/billing/authorizations/issue",
             headers=get_auth_header(),
             json={
@@ -255,7 +318,7 @@ def create_billing_key(
             timeout=30,
         )
 
-        data = response.json()
+        data = _json_loads(response.content)
         return response.status_code == 200, data
 
     except Exception as e:
@@ -272,8 +335,22 @@ def charge_billing(
     """
     빌링키로 결제 (정기결제 실행)
     """
+    return _PAYMENT_INFLIGHT.do(
+        ("billing", customer_key, order_id),
+        _charge_billing, billing_key, customer_key, amount, order_id, order_name,
+    )
+
+
+def _charge_billing(
+    billing_key: str,
+    customer_key: str,
+    amount: int,
+    order_id: str,
+    order_name: str,
+) -> Tuple[bool, Dict]:
+    """빌링 결제 API 호출"""
     try:
-        response = requests.post(
+        response = _TOSS_SESSION.post(
             f"{TOSS_API_URL}/billing/{billing_key}",
             headers=get_auth_header(),
             json={
@@ -285,7 +362,7 @@ def charge_billing(
             timeout=30,
         )
 
-        data = response.json()
+        data = _json_loads(response.content)
         return response.status_code == 200, data
 
     except Exception as e:
@@ -296,10 +373,14 @@ def charge_billing(
 # 헬퍼 함수
 # ================================
 
+# 주문 ID 고유 접미사 (프로세스 시작 시각 + PID + 증가 카운터, 16진수)
+_ORDER_ID_BASE = f"{int(time.time()):x}-{os.getpid():x}-"
+_ORDER_COUNTER = itertools.count()
+
+
 def generate_order_id(user_id: str, plan_id: str) -> str:
-    """주문 ID 생성"""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    return f"SGY_{user_id}_{plan_id}_{timestamp}"
+    """주문 ID 생성 (프로세스 내 카운터 기반, 시각 조회/포맷 없음)"""
+    return f"SGY_{user_id}_{plan_id}_{_ORDER_ID_BASE}{next(_ORDER_COUNTER):x}"
 
 
 def get_plan_info(plan_id: str) -> Optional[Dict]:
@@ -312,16 +393,7 @@ def calculate_subscription_end(plan_id: str, start_date: datetime = None) -> dat
     if start_date is None:
         start_date = datetime.now()
 
-    plan = PRICE_PLANS.get(plan_id)
-    if not plan:
-        return start_date
-
-    if plan["period"] == "monthly":
-        return start_date + timedelta(days=30)
-    elif plan["period"] == "yearly":
-        return start_date + timedelta(days=365)
-    else:
-        return start_date
+    return start_date + _PLAN_DELTAS.get(plan_id, _NO_DELTA)
 
 
 def format_price(price: int) -> str:
@@ -2,10 +2,20 @@
 감정평가서 PDF 분석기
 PDF에서 텍스트 추출 및 주요 정보 파싱
 """
+import os
 import re
+import json
+import hashlib
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from config import CACHE_DIR
+from services.logger import get_logger
+
+logger = get_logger("pdf_analyzer")
+
 # PDF 처리 라이브러리 (선택적 import)
 try:
     import pdfplumber
@@ -19,39 +29,227 @@ try:
 except ImportError:
     PYMUPDF_AVAILABLE = False
 
+# 추출 텍스트/분석 결과 디스크 캐시 경로
+PDF_CACHE_DIR = Path(CACHE_DIR) / "pdf"
+
+# 디스크 캐시 버전 (텍스트 추출 / APPRAISAL_PATTERNS / _convert 변경 시 올림)
+PARSER_VERSION = 4
+
+# 다중 패턴 스캐너 (선택적 import, 대량 PDF 분석 시 사전 필터)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+# 추출 패턴
+APPRAISAL_PATTERNS = {
+    # 기본 정보
+    "case_no": r"사건번호[:\s]*(\d{4}타경\d+)",
+    "court": r"(서울[가-힣]+지방법원)",
+    "appraisal_date": r"평가기준일[:\s]*(\d{4}[.\-년]\s*\d{1,2}[.\-월]\s*\d{1,2}일?)",
+
+    # 물건 정보
+    "address": r"소\s*재\s*지[:\s]*([^\n]+)",
+    "land_area": r"토지[면적:\s]*([\d,.]+)\s*㎡",
+    "building_area": r"건물[면적:\s]*([\d,.]+)\s*㎡",
+    "exclusive_area": r"전용면적[:\s]*([\d,.]+)\s*㎡",
+
+    # 가격 정보
+    "total_price": r"감정평가액[:\s]*([\d,]+)\s*원",
+    "land_price": r"토지[가액가격:\s]*([\d,]+)\s*원",
+    "building_price": r"건물[가액가격:\s]*([\d,]+)\s*원",
+    "price_per_pyeong": r"평당[단가가격:\s]*([\d,]+)\s*원",
+
+    # 건물 정보
+    "building_year": r"(준공|신축|사용승인)[년일:\s]*(\d{4})",
+    "structure": r"구\s*조[:\s]*([^\n]+)",
+    "floors": r"층\s*수[:\s]*([^\n]+)",
+}
+
+# 컴파일된 추출 패턴 (키 → 정규식)
+_COMPILED_PATTERNS = {
+    key: re.compile(pattern, re.IGNORECASE)
+    for key, pattern in APPRAISAL_PATTERNS.items()
+}
+
+# 값이 들어있는 그룹 번호 (기본 1, 건물 연도는 그룹 2)
+_GROUP_INDEX = {"building_year": 2}
+
+# 필드별 값 변환 (가격: 원 단위 정수, 면적: ㎡ 실수)
+_FIELD_CONVERTERS = {
+    "total_price": int,
+    "land_price": int,
+    "building_price": int,
+    "price_per_pyeong": int,
+    "land_area": float,
+    "building_area": float,
+    "exclusive_area": float,
+}
+
+# hyperscan 스크래치 공간은 스레드 간 공유 불가
+_HYPERSCAN_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_hyperscan_db():
+    """
+    전체 추출 패턴을 하나의 hyperscan DB로 컴파일 (최초 1회)
+
+    Returns:
+        (DB, 패턴 키 리스트), 사용 불가 시 None
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+
+    keys = list(APPRAISAL_PATTERNS)
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+        | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[APPRAISAL_PATTERNS[key].encode("utf-8") for key in keys],
+            ids=list(range(len(keys))),
+            flags=[flags] * len(keys),
+        )
+        return db, keys
+    except Exception as e:
+        logger.warning("[PDF] hyperscan 컴파일 실패, re 사용: %s", e)
+        return None
+
+
+def _hyperscan_keys(text: str) -> Optional[set]:
+    """
+    hyperscan으로 텍스트에 존재하는 패턴 키만 선별
+
+    Returns:
+        매치된 키 집합, hyperscan 사용 불가 시 None
+    """
+    compiled = _get_hyperscan_db()
+    if compiled is None:
+        return None
+
+    db, keys = compiled
+    hits = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(keys[pattern_id])
+
+    with _HYPERSCAN_LOCK:
+        db.scan(text.encode("utf-8"), match_event_handler=on_match)
+
+    return hits
+
+
+# ============================================================
+# 텍스트/분석 결과 캐시
+# ============================================================
+
+def _extract_text_from_pdf(pdf_path: str) -> str:
+    """PDF에서 텍스트 추출 (캐시 없이)"""
+    text = ""
+
+    # 방법 1: PyMuPDF (권장, C 기반으로 빠름)
+    if PYMUPDF_AVAILABLE:
+        try:
+            flags = fitz.TEXT_DEHYPHENATE | fitz.TEXT_PRESERVE_WHITESPACE
+            with fitz.open(pdf_path) as doc:
+                text = "\n".join(page.get_text("text", flags=flags) for page in doc)
+
+            if len(text.strip()) > 100:
+                return text
+        except Exception as e:
+            logger.warning("[PDF] PyMuPDF 오류: %s", e)
+
+    # 방법 2: pdfplumber (폴백)
+    if PDFPLUMBER_AVAILABLE:
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        text += page_text + "\n"
+
+            if len(text.strip()) > 100:
+                return text
+        except Exception as e:
+            logger.warning("[PDF] pdfplumber 오류: %s", e)
+
+    return text
+
+
+@lru_cache(maxsize=64)
+def _file_sha1(pdf_path: str, mtime_ns: int, size: int) -> str:
+    """파일 SHA-1 (경로/수정시각/크기가 같으면 재계산하지 않음)"""
+    digest = hashlib.sha1()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_cache_file(path: Path, content: str):
+    """캐시 파일 저장 (임시 파일 → 교체, 실패 무시)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("[PDF] 캐시 저장 실패: %s", e)
+
+
+@lru_cache(maxsize=128)
+def _extract_text_cached(pdf_path: str, mtime_ns: int, size: int) -> str:
+    """
+    텍스트 추출 캐시 (메모리 → 디스크 {sha1}-v{버전}.txt → PDF 파싱)
+
+    Args:
+        pdf_path: PDF 파일 경로
+        mtime_ns: 파일 수정 시각 (캐시 키)
+        size: 파일 크기 (캐시 키)
+
+    Returns:
+        추출된 텍스트
+    """
+    sha1 = _file_sha1(pdf_path, mtime_ns, size)
+    cache_path = PDF_CACHE_DIR / f"{sha1}-v{PARSER_VERSION}.txt"
+    if cache_path.exists():
+        return cache_path.read_text(encoding="utf-8")
+
+    text = _extract_text_from_pdf(pdf_path)
+    if text:
+        _write_cache_file(cache_path, text)
+    return text
+
+
+def _info_cache_path(pdf_path: str) -> Optional[Path]:
+    """파싱 결과 캐시 경로 ({sha1}-v{버전}.json), 파일 접근 불가 시 None"""
+    try:
+        stat = os.stat(pdf_path)
+        sha1 = _file_sha1(str(pdf_path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+    return PDF_CACHE_DIR / f"{sha1}-v{PARSER_VERSION}.json"
+
 
 class AppraisalPDFAnalyzer:
     """감정평가서 PDF 분석기"""
 
     def __init__(self):
-        # 추출 패턴
-        self.patterns = {
-            # 기본 정보
-            "case_no": r"사건번호[:\s]*(\d{4}타경\d+)",
-            "court": r"(서울[가-힣]+지방법원)",
-            "appraisal_date": r"평가기준일[:\s]*(\d{4}[.\-년]\s*\d{1,2}[.\-월]\s*\d{1,2}일?)",
-
-            # 물건 정보
-            "address": r"소\s*재\s*지[:\s]*([^\n]+)",
-            "land_area": r"토지[면적:\s]*([\d,.]+)\s*㎡",
-            "building_area": r"건물[면적:\s]*([\d,.]+)\s*㎡",
-            "exclusive_area": r"전용면적[:\s]*([\d,.]+)\s*㎡",
-
-            # 가격 정보
-            "total_price": r"감정평가액[:\s]*([\d,]+)\s*원",
-            "land_price": r"토지[가액가격:\s]*([\d,]+)\s*원",
-            "building_price": r"건물[가액가격:\s]*([\d,]+)\s*원",
-            "price_per_pyeong": r"평당[단가가격:\s]*([\d,]+)\s*원",
-
-            # 건물 정보
-            "building_year": r"(준공|신축|사용승인)[년일:\s]*(\d{4})",
-            "structure": r"구\s*조[:\s]*([^\n]+)",
-            "floors": r"층\s*수[:\s]*([^\n]+)",
-        }
+        # 추출 패턴 (모듈 로드 시 컴파일된 패턴 공유)
+        self.patterns = dict(APPRAISAL_PATTERNS)
+        self._compiled = _COMPILED_PATTERNS
 
     def extract_text(self, pdf_path: str) -> str:
         """
-        PDF에서 텍스트 추출
+        PDF에서 텍스트 추출 (같은 파일은 캐시 재사용)
 
         Args:
             pdf_path: PDF 파일 경로
@@ -59,36 +257,12 @@ class AppraisalPDFAnalyzer:
         Returns:
             추출된 텍스트
         """
-        text = ""
-
-        # 방법 1: pdfplumber (권장)
-        if PDFPLUMBER_AVAILABLE:
-            try:
-                with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-
-                if len(text.strip()) > 100:
-                    return text
-            except Exception as e:
-                print(f"[PDF] pdfplumber 오류: {e}")
-
-        # 방법 2: PyMuPDF (폴백)
-        if PYMUPDF_AVAILABLE:
-            try:
-                doc = fitz.open(pdf_path)
-                for page in doc:
-                    text += page.get_text() + "\n"
-                doc.close()
-
-                if len(text.strip()) > 100:
-                    return text
-            except Exception as e:
-                print(f"[PDF] PyMuPDF 오류: {e}")
-
-        return text
+        try:
+            stat = os.stat(pdf_path)
+        except OSError:
+            return _extract_text_from_pdf(pdf_path)
+
+        return _extract_text_cached(str(pdf_path), stat.st_mtime_ns, stat.st_size)
 
     def parse_info(self, text: str) -> Dict[str, Any]:
         """
@@ -100,36 +274,36 @@ class AppraisalPDFAnalyzer:
         Returns:
             추출된 정보 딕셔너리
         """
-        result = {}
-
-        for key, pattern in self.patterns.items():
-            match = re.search(pattern, text, re.IGNORECASE)
+        found = {}
+
+        # hyperscan 사용 가능 시: 존재하는 패턴만 re로 값 추출
+        hits = _hyperscan_keys(text)
+        if hits is not None:
+            for key in hits:
+                match = self._compiled[key].search(text)
+                if match:
+                    found[key] = self._convert(key, match.group(_GROUP_INDEX.get(key, 1)).strip())
+            return {key: found[key] for key in self.patterns if key in found}
+
+        # 패턴별 검색 (각 패턴의 첫 매치)
+        for key, pattern in self._compiled.items():
+            match = pattern.search(text)
             if match:
-                # 건물 연도는 그룹 2
-                if key == "building_year":
-                    result[key] = match.group(2) if len(match.groups()) > 1 else match.group(1)
-                else:
-                    result[key] = match.group(1).strip()
-
-        # 가격 정규화 (쉼표 제거)
-        price_keys = ["total_price", "land_price", "building_price", "price_per_pyeong"]
-        for key in price_keys:
-            if key in result:
-                try:
-                    result[key] = int(result[key].replace(",", ""))
-                except:
-                    pass
-
-        # 면적 정규화
-        area_keys = ["land_area", "building_area", "exclusive_area"]
-        for key in area_keys:
-            if key in result:
-                try:
-                    result[key] = float(result[key].replace(",", ""))
-                except:
-                    pass
-
-        return result
+                found[key] = self._convert(key, match.group(_GROUP_INDEX.get(key, 1)).strip())
+
+        # 패턴 정의 순서로 결과 구성
+        return {key: found[key] for key in self.patterns if key in found}
+
+    @staticmethod
+    def _convert(key: str, value: str) -> Any:
+        """필드 타입에 맞게 값 변환 (가격: int, 면적: float, 실패 시 원문)"""
+        convert = _FIELD_CONVERTERS.get(key)
+        if convert is None:
+            return value
+        try:
+            return convert(value.replace(",", ""))
+        except ValueError:
+            return value
 
     def analyze(self, pdf_path: str) -> Dict[str, Any]:
         """
@@ -152,8 +326,14 @@ class AppraisalPDFAnalyzer:
                 "raw_text": text[:500] if text else "",
             }
 
-        # 정보 파싱
-        info = self.parse_info(text)
+        # 정보 파싱 (같은 파일은 디스크 캐시 재사용)
+        info_path = _info_cache_path(pdf_path)
+        if info_path is not None and info_path.exists():
+            info = json.loads(info_path.read_text(encoding="utf-8"))
+        else:
+            info = self.parse_info(text)
+            if info_path is not None:
+                _write_cache_file(info_path, json.dumps(info, ensure_ascii=False))
 
         return {
             "success": True,
@@ -3,10 +3,17 @@
 한국감정평가사협회(kapanet.or.kr) 서버에서 PDF 다운로드
 """
 import re
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import Optional, Tuple
 
+from services.logger import get_logger
+
+logger = get_logger("pdf_downloader")
+
 
 # 감정평가사협회 PDF 서버
 KAPANET_BASE_URL = "https://ca.kapanet.or.kr"
@@ -17,6 +24,36 @@ DEFAULT_HEADERS = {
     "Accept": "*/*",
 }
 
+# 요청별 추가 헤더 (기본 헤더는 세션에 설정, 호출마다 새로 만들지 않음)
+_VIEWER_HEADERS = {"Referer": "https://www.courtauction.go.kr/"}
+_PDF_HEADERS = {"Referer": f"{KAPANET_BASE_URL}/", "Accept-Encoding": "identity"}
+
+# 뷰어 HTML의 PDF 경로 패턴 (바이트 단위로 검색)
+# 예: .src='/825B2D1A/001/EF313201/UI241206-01-001.pdf'
+_PDF_SRC_RE = re.compile(rb"\.src\s*=\s*['\"]([^'\"]+\.pdf)['\"]")
+
+# 청크 경계에 걸친 매치를 위해 다시 검사하는 길이
+_PDF_SRC_OVERLAP = 512
+
+# 뷰어 페이지 읽기 청크 크기
+VIEWER_CHUNK_SIZE = 8 * 1024
+
+# PDF 다운로드 청크 크기 (스트리밍 저장)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 감정평가서 서버 동시 요청 상한
+KAPANET_MAX_CONCURRENCY = 4
+_KAPANET_SEMAPHORE = threading.BoundedSemaphore(KAPANET_MAX_CONCURRENCY)
+
+# 감정평가서 서버 공유 세션 (뷰어 → PDF 요청 간 keep-alive 연결 재사용)
+_KAPANET_SESSION = requests.Session()
+_KAPANET_SESSION.headers.update(DEFAULT_HEADERS)
+_KAPANET_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
+
 
 def get_pdf_url_from_viewer(viewer_url: str) -> Optional[str]:
     """
@@ -29,26 +66,76 @@ def get_pdf_url_from_viewer(viewer_url: str) -> Optional[str]:
         실제 PDF URL 또는 None
     """
     try:
-        headers = {**DEFAULT_HEADERS, "Referer": "https://www.courtauction.go.kr/"}
-        resp = requests.get(viewer_url, headers=headers, timeout=15)
-
-        if resp.status_code != 200:
-            return None
-
-        # HTML에서 PDF URL 추출
-        # 패턴: src='/825B2D1A/001/EF313201/UI241206-01-001.pdf'
-        match = re.search(r"\.src\s*=\s*['\"]([^'\"]+\.pdf)['\"]", resp.text)
-        if match:
-            pdf_path = match.group(1)
-            return f"{KAPANET_BASE_URL}{pdf_path}"
+        with _KAPANET_SEMAPHORE, _KAPANET_SESSION.get(
+            viewer_url,
+            headers=_VIEWER_HEADERS,
+            timeout=15,
+            stream=True,
+        ) as resp:
+            if resp.status_code != 200:
+                return None
+
+            # HTML에서 PDF URL 추출 (찾는 즉시 나머지 본문은 읽지 않음)
+            buffer = b""
+            for chunk in resp.iter_content(VIEWER_CHUNK_SIZE):
+                search_from = max(0, len(buffer) - _PDF_SRC_OVERLAP)
+                buffer += chunk
+                match = _PDF_SRC_RE.search(buffer, search_from)
+                if match:
+                    pdf_path = match.group(1).decode("utf-8", errors="replace")
+                    return f"{KAPANET_BASE_URL}{pdf_path}"
 
         return None
 
     except Exception as e:
-        print(f"[PDF] 뷰어 페이지 오류: {e}")
+        logger.error("[PDF] 뷰어 페이지 오류: %s", e)
         return None
 
 
+def _stream_pdf(pdf_url: str, output_path: str) -> Tuple[bool, str]:
+    """
+    PDF를 청크 단위로 디스크에 저장 (본문 전체를 메모리에 올리지 않음)
+
+    Args:
+        pdf_url: PDF URL
+        output_path: 저장 경로
+
+    Returns:
+        (성공 여부, 파일 경로 또는 에러 메시지)
+    """
+    with _KAPANET_SEMAPHORE, _KAPANET_SESSION.get(
+        pdf_url,
+        headers=_PDF_HEADERS,
+        timeout=60,
+        stream=True,
+    ) as resp:
+        if resp.status_code != 200:
+            return False, f"다운로드 실패: {resp.status_code}"
+
+        # 세션 만료 시 오는 HTML 에러 페이지는 본문을 읽지 않고 중단
+        if resp.headers.get("Content-Type", "").startswith("text/html"):
+            return False, "유효한 PDF 파일이 아닙니다"
+
+        # PDF 확인 (첫 청크의 시그니처만 보고 판단, 아니면 나머지는 받지 않음)
+        chunks = resp.iter_content(DOWNLOAD_CHUNK_SIZE)
+        first = next(chunks, b"")
+        if not first.startswith(b"%PDF"):
+            return False, "유효한 PDF 파일이 아닙니다"
+
+        path = Path(output_path)
+        try:
+            with path.open("wb") as f:
+                f.write(first)
+                for chunk in chunks:
+                    f.write(chunk)
+        except Exception:
+            # 중간에 끊긴 파일은 남기지 않음
+            path.unlink(missing_ok=True)
+            raise
+
+    return True, output_path
+
+
 def download_appraisal_pdf(
     court_code: str,
     case_no: str,
@@ -83,25 +170,13 @@ def download_appraisal_pdf(
     if not pdf_url:
         return False, "PDF URL을 찾을 수 없습니다"
 
+    # 저장 경로
+    if not output_path:
+        output_path = f"appraisal_{case_no}_{item_no}.pdf"
+
     # PDF 다운로드
     try:
-        headers = {**DEFAULT_HEADERS, "Referer": f"{KAPANET_BASE_URL}/"}
-        resp = requests.get(pdf_url, headers=headers, timeout=60)
-
-        if resp.status_code != 200:
-            return False, f"다운로드 실패: {resp.status_code}"
-
-        # PDF 확인
-        if not resp.content.startswith(b"%PDF"):
-            return False, "유효한 PDF 파일이 아닙니다"
-
-        # 저장 경로
-        if not output_path:
-            output_path = f"appraisal_{case_no}_{item_no}.pdf"
-
-        Path(output_path).write_bytes(resp.content)
-
-        return True, output_path
+        return _stream_pdf(pdf_url, output_path)
 
     except Exception as e:
         return False, f"다운로드 오류: {e}"
@@ -119,17 +194,7 @@ def download_pdf_direct(pdf_url: str, output_path: str) -> Tuple[bool, str]:
         (성공 여부, 파일 경로 또는 에러 메시지)
     """
     try:
-        headers = {**DEFAULT_HEADERS, "Referer": f"{KAPANET_BASE_URL}/"}
-        resp = requests.get(pdf_url, headers=headers, timeout=60)
-
-        if resp.status_code != 200:
-            return False, f"다운로드 실패: {resp.status_code}"
-
-        if not resp.content.startswith(b"%PDF"):
-            return False, "유효한 PDF 파일이 아닙니다"
-
-        Path(output_path).write_bytes(resp.content)
-        return True, output_path
+        return _stream_pdf(pdf_url, output_path)
 
     except Exception as e:
         return False, f"다운로드 오류: {e}"
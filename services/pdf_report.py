@@ -2,49 +2,211 @@
 서경아 PDF 리포트 생성 서비스
 경매 물건 분석 리포트 (4,900원 트립와이어)
 """
+import copy
 import io
-from datetime import datetime
+import re
+import threading
+from functools import lru_cache
+from datetime import date, datetime
 from typing import Dict, Any, Optional
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import mm
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    Image, PageBreak, HRFlowable
-)
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from xml.sax.saxutils import escape
 import os
 
+from services.logger import get_logger
+
+logger = get_logger("pdf_report")
+
+# ReportLab 은 첫 PDF 생성 시 _load_reportlab() 에서 import
+# (탭 렌더링/리런마다 import 비용을 내지 않도록)
+
+
+# 리포트 bytes 캐시 크기 (건당 수십~수백 KB)
+REPORT_CACHE_SIZE = 128
+
+# 디버그 모드 (SEOGYEONGA_DEBUG=1 이면 ReportLab 도형 좌표 검사 유지)
+DEBUG = os.getenv("SEOGYEONGA_DEBUG", "").lower() in ("1", "true", "yes")
 
 # 한글 폰트 설정 (Windows 기준)
 FONT_PATH = "C:/Windows/Fonts/malgun.ttf"
 FONT_NAME = "Malgun"
 
-try:
-    if os.path.exists(FONT_PATH):
-        pdfmetrics.registerFont(TTFont(FONT_NAME, FONT_PATH))
-    else:
-        # 대체 폰트 경로 시도
-        alt_paths = [
-            "C:/Windows/Fonts/gulim.ttc",
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-        ]
-        for path in alt_paths:
+# 대체 폰트 경로
+ALT_FONT_PATHS = [
+    "C:/Windows/Fonts/gulim.ttc",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+]
+
+_FONT_REGISTERED = False
+
+_REPORTLAB_LOADED = False
+_REPORTLAB_LOCK = threading.Lock()
+
+
+def _register_font(pdfmetrics, TTFont) -> str:
+    """
+    한글 폰트 등록 (프로세스당 1회)
+
+    Args:
+        pdfmetrics: reportlab.pdfbase.pdfmetrics 모듈
+        TTFont: reportlab.pdfbase.ttfonts.TTFont 클래스
+
+    Returns:
+        사용할 폰트 이름 (실패 시 Helvetica)
+    """
+    global _FONT_REGISTERED
+    if _FONT_REGISTERED or FONT_NAME in pdfmetrics.getRegisteredFontNames():
+        _FONT_REGISTERED = True
+        return FONT_NAME
+
+    try:
+        for path in [FONT_PATH] + ALT_FONT_PATHS:
             if os.path.exists(path):
                 pdfmetrics.registerFont(TTFont(FONT_NAME, path))
-                break
-except Exception as e:
-    print(f"[WARN] 한글 폰트 로드 실패: {e}")
-    FONT_NAME = "Helvetica"
+                _FONT_REGISTERED = True
+                return FONT_NAME
+    except Exception as e:
+        logger.warning("[REPORT] 한글 폰트 로드 실패: %s", e)
+        return "Helvetica"
+
+    # 폰트 파일이 없으면 미등록 이름으로 빌드가 실패하므로 기본 폰트 사용
+    logger.warning("[REPORT] 한글 폰트 파일 없음 - Helvetica 사용")
+    return "Helvetica"
+
+
+def _load_reportlab():
+    """
+    ReportLab 지연 로딩 (프로세스당 1회)
+    - 모듈 import, 폰트 등록, 색상 / 테이블 스타일 상수 생성
+    """
+    global _REPORTLAB_LOADED
+    global colors, A4, getSampleStyleSheet, ParagraphStyle, mm, TA_CENTER
+    global SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, HRFlowable
+    global FONT_NAME, DIVIDER_COLOR, RISK_COLORS
+    global _RISK_TABLE_STYLE, _INFO_TABLE_STYLE, _PRICE_TABLE_STYLE, _CHECKLIST_TABLE_STYLE
+
+    if _REPORTLAB_LOADED:
+        return
+
+    with _REPORTLAB_LOCK:
+        if _REPORTLAB_LOADED:
+            return
+
+        from reportlab import rl_config
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import mm
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.platypus import (
+            SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+            PageBreak, HRFlowable
+        )
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        if not DEBUG:
+            rl_config.shapeChecking = 0
+
+        FONT_NAME = _register_font(pdfmetrics, TTFont)
+
+        # 구분선 / 테이블 격자 색상 (HexColor 파싱 1회)
+        DIVIDER_COLOR = colors.HexColor("#E5E7EB")
+
+        # 위험도별 색상
+        RISK_COLORS = {
+            "안전": colors.HexColor("#10B981"),
+            "주의": colors.HexColor("#F59E0B"),
+            "위험": colors.HexColor("#EF4444"),
+        }
+
+        # 테이블 스타일 (리포트마다 동일)
+        _RISK_TABLE_STYLE = TableStyle([
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
+            ('FONTSIZE', (0, 0), (-1, -1), 14),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+            ('ROUNDEDCORNERS', (0, 0), (-1, -1), 5),
+        ])
+
+        _INFO_TABLE_STYLE = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#F3F4F6")),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor("#374151")),
+            ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, DIVIDER_COLOR),
+        ])
+
+        _PRICE_TABLE_STYLE = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#DBEAFE")),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor("#1E40AF")),
+            ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, DIVIDER_COLOR),
+        ])
+
+        # 체크리스트 (Body 문단과 같은 글꼴/색, 행 높이 = leading 16 + spaceAfter 8)
+        _CHECKLIST_TABLE_STYLE = TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('LEADING', (0, 0), (-1, -1), 16),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor("#4B5563")),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 2),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ])
+
+        _REPORTLAB_LOADED = True
+
+
+# ============================================
+# 체크리스트 / 면책조항 (리포트마다 동일)
+# ============================================
+
+# AI 분석 텍스트에서 제거할 마크다운 기호 (굵게 / 제목)
+_MARKDOWN_RE = re.compile(r"\*\*|#+")
+
+CHECKLIST_ITEMS = (
+    "☐ 등기부등본 최신본 발급 확인",
+    "☐ 현황조사서 내용 검토",
+    "☐ 매각물건명세서 확인",
+    "☐ 임차인 현황 파악",
+    "☐ 배당요구종기 확인",
+    "☐ 현장 방문 및 상태 확인",
+    "☐ 관리비 체납 여부 확인",
+    "☐ 예상 취득세/등록세 계산",
+    "☐ 입찰보증금 준비 (최저가의 10%)",
+    "☐ 잔금 조달 계획 수립",
+)
+
+# 체크리스트 테이블 데이터 (한 행에 한 항목)
+_CHECKLIST_DATA = [[item] for item in CHECKLIST_ITEMS]
+
+DISCLAIMER = (
+    "본 리포트는 참고용으로 제공되며, 투자 결정의 근거로 사용할 수 없습니다. "
+    "실제 투자 전 반드시 법률 전문가 및 부동산 전문가와 상담하시기 바랍니다. "
+    "서경아는 본 리포트의 내용에 대해 법적 책임을 지지 않습니다."
+)
 
 
 def format_price(price: int) -> str:
     """가격 포맷 (억/만원)"""
     if not price:
         return "-"
+    return _format_price_cached(price)
+
+
+@lru_cache(maxsize=4096)
+def _format_price_cached(price: int) -> str:
+    """가격 포맷 본체 (0/None 제외, 결과 캐시)"""
     if price >= 100000000:
         억 = price // 100000000
         만 = (price % 100000000) // 10000
@@ -54,18 +216,16 @@ def format_price(price: int) -> str:
     return f"{price:,}원"
 
 
-def get_risk_color(risk_level: str) -> colors.Color:
+def get_risk_color(risk_level: str) -> "colors.Color":
     """위험도별 색상"""
-    risk_colors = {
-        "안전": colors.HexColor("#10B981"),
-        "주의": colors.HexColor("#F59E0B"),
-        "위험": colors.HexColor("#EF4444"),
-    }
-    return risk_colors.get(risk_level, colors.gray)
+    _load_reportlab()
+    return RISK_COLORS.get(risk_level, colors.gray)
 
 
-def create_styles() -> Dict[str, ParagraphStyle]:
-    """스타일 생성"""
+@lru_cache(maxsize=1)
+def create_styles() -> Dict[str, "ParagraphStyle"]:
+    """스타일 생성 (최초 1회 생성 후 재사용)"""
+    _load_reportlab()
     base_styles = getSampleStyleSheet()
 
     styles = {
@@ -133,12 +293,94 @@ def create_styles() -> Dict[str, ParagraphStyle]:
     return styles
 
 
+@lru_cache(maxsize=1)
+def _static_flowables() -> Dict[str, Any]:
+    """리포트마다 동일한 문단 (최초 1회 파싱)"""
+    styles = create_styles()
+    return {
+        "overview": Paragraph("📋 물건 개요", styles["Heading1"]),
+        "price": Paragraph("💰 가격 정보", styles["Heading1"]),
+        "risk": Paragraph("⚠️ 위험 분석", styles["Heading1"]),
+        "no_risk": Paragraph("특별한 위험 요소가 발견되지 않았습니다.", styles["Body"]),
+        "analysis": Paragraph("🤖 AI 권리분석 결과", styles["Heading2"]),
+        "checklist": Paragraph("✅ 입찰 전 체크리스트", styles["Heading1"]),
+        "disclaimer": Paragraph(DISCLAIMER, styles["Caption"]),
+    }
+
+
+def _static(name: str):
+    """
+    정적 문단 조회
+
+    Args:
+        name: _static_flowables 키
+
+    Returns:
+        얕은 복사본 (파싱 결과는 공유, wrap/split 레이아웃 상태는 리포트별)
+    """
+    return copy.copy(_static_flowables()[name])
+
+
+def _divider(space_before: float = 1, space_after: float = 1) -> "HRFlowable":
+    """섹션 구분선 (앞뒤 여백을 Spacer 대신 선 자체에 지정)"""
+    return HRFlowable(
+        width="100%", thickness=1, color=DIVIDER_COLOR,
+        spaceBefore=space_before, spaceAfter=space_after,
+    )
+
+
 def generate_auction_report(
     auction: Dict[str, Any],
     analysis: str = "",
     include_checklist: bool = True
 ) -> bytes:
-    """경매 물건 PDF 리포트 생성"""
+    """경매 물건 PDF 리포트 생성 (bytes, session_state 보관용 / 같은 입력은 캐시)"""
+    try:
+        frozen_auction = tuple(sorted(auction.items()))
+        hash(frozen_auction)
+    except TypeError:
+        # 리스트 등 해시 불가 값이 있으면 캐시 없이 생성
+        return generate_auction_report_stream(auction, analysis, include_checklist).getvalue()
+
+    # 표지에 생성일이 들어가므로 날짜도 키에 포함
+    return _build_report_cached(frozen_auction, analysis, include_checklist, date.today())
+
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _build_report_cached(
+    frozen_auction: tuple,
+    analysis: str,
+    include_checklist: bool,
+    report_date: date,
+) -> bytes:
+    """리포트 bytes 캐시 본체 (frozen_auction: 정렬된 (키, 값) 튜플)"""
+    return generate_auction_report_stream(
+        dict(frozen_auction), analysis, include_checklist
+    ).getvalue()
+
+
+def clear_report_cache():
+    """리포트 캐시 비우기 (물건 정보 수정 시)"""
+    _build_report_cached.cache_clear()
+
+
+def generate_auction_report_stream(
+    auction: Dict[str, Any],
+    analysis: str = "",
+    include_checklist: bool = True
+) -> io.BytesIO:
+    """
+    경매 물건 PDF 리포트 생성 (버퍼 반환)
+
+    Args:
+        auction: 경매 물건 정보
+        analysis: AI 분석 텍스트
+        include_checklist: 체크리스트 페이지 포함 여부
+
+    Returns:
+        처음 위치로 되감은 BytesIO (st.download_button 에 그대로 전달 가능)
+    """
+    _load_reportlab()
 
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(
@@ -148,6 +390,7 @@ def generate_auction_report(
         leftMargin=20*mm,
         topMargin=20*mm,
         bottomMargin=20*mm,
+        pageCompression=1,
     )
 
     styles = create_styles()
@@ -176,23 +419,18 @@ def generate_auction_report(
         [[f"종합 위험도: {risk_level}"]],
         colWidths=[80*mm],
     )
-    risk_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), risk_color),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
-        ('FONTSIZE', (0, 0), (-1, -1), 14),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('ROUNDEDCORNERS', (0, 0), (-1, -1), 5),
-    ]))
+    # 공통 스타일(parent 복사) + 위험도 배경색
+    risk_table.setStyle(TableStyle(
+        [('BACKGROUND', (0, 0), (-1, -1), risk_color)],
+        parent=_RISK_TABLE_STYLE,
+    ))
     story.append(risk_table)
 
     story.append(PageBreak())
 
     # ===== 물건 개요 =====
-    story.append(Paragraph("📋 물건 개요", styles["Heading1"]))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor("#E5E7EB")))
+    story.append(_static("overview"))
+    story.append(_divider())
 
     # 기본 정보 테이블
     info_data = [
@@ -206,24 +444,13 @@ def generate_auction_report(
         ["입찰일", str(auction.get('auction_date', '-'))],
     ]
 
-    info_table = Table(info_data, colWidths=[40*mm, 120*mm])
-    info_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#F3F4F6")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor("#374151")),
-        ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#E5E7EB")),
-    ]))
+    info_table = Table(info_data, colWidths=[40*mm, 120*mm], spaceAfter=10*mm)
+    info_table.setStyle(_INFO_TABLE_STYLE)
     story.append(info_table)
-    story.append(Spacer(1, 10*mm))
 
     # ===== 가격 정보 =====
-    story.append(Paragraph("💰 가격 정보", styles["Heading1"]))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor("#E5E7EB")))
+    story.append(_static("price"))
+    story.append(_divider())
 
     appraisal = auction.get('appraisal_price', 0)
     min_price = auction.get('min_price', 0)
@@ -236,81 +463,50 @@ def generate_auction_report(
         ["할인율", f"-{discount}%", ""],
     ]
 
-    price_table = Table(price_data, colWidths=[40*mm, 60*mm, 60*mm])
-    price_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#DBEAFE")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor("#1E40AF")),
-        ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#E5E7EB")),
-    ]))
+    price_table = Table(price_data, colWidths=[40*mm, 60*mm, 60*mm], spaceAfter=10*mm)
+    price_table.setStyle(_PRICE_TABLE_STYLE)
     story.append(price_table)
-    story.append(Spacer(1, 10*mm))
 
     # ===== 위험 분석 =====
-    story.append(Paragraph("⚠️ 위험 분석", styles["Heading1"]))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor("#E5E7EB")))
+    story.append(_static("risk"))
+    story.append(_divider())
 
     risk_reason = auction.get('risk_reason', '')
     if risk_reason:
         story.append(Paragraph(f"위험 사유: {risk_reason}", styles["Warning"]))
     else:
-        story.append(Paragraph("특별한 위험 요소가 발견되지 않았습니다.", styles["Body"]))
+        story.append(_static("no_risk"))
 
     story.append(Spacer(1, 5*mm))
 
     # AI 분석 결과
     if analysis:
-        story.append(Paragraph("🤖 AI 권리분석 결과", styles["Heading2"]))
-        # 마크다운 변환 (간단한 처리)
-        analysis_text = analysis.replace("**", "").replace("##", "").replace("#", "")
-        for line in analysis_text.split("\n"):
-            if line.strip():
-                story.append(Paragraph(line.strip(), styles["Body"]))
-        story.append(Spacer(1, 10*mm))
+        story.append(_static("analysis"))
+        # 마크다운 기호 제거 후 한 문단으로 (줄바꿈은 <br/>)
+        analysis_text = _MARKDOWN_RE.sub("", analysis)
+        lines = [escape(line.strip()) for line in analysis_text.split("\n") if line.strip()]
+        if lines:
+            story.append(Paragraph("<br/>".join(lines), styles["Body"]))
 
     # ===== 체크리스트 =====
     if include_checklist:
         story.append(PageBreak())
-        story.append(Paragraph("✅ 입찰 전 체크리스트", styles["Heading1"]))
-        story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor("#E5E7EB")))
-
-        checklist_items = [
-            "☐ 등기부등본 최신본 발급 확인",
-            "☐ 현황조사서 내용 검토",
-            "☐ 매각물건명세서 확인",
-            "☐ 임차인 현황 파악",
-            "☐ 배당요구종기 확인",
-            "☐ 현장 방문 및 상태 확인",
-            "☐ 관리비 체납 여부 확인",
-            "☐ 예상 취득세/등록세 계산",
-            "☐ 입찰보증금 준비 (최저가의 10%)",
-            "☐ 잔금 조달 계획 수립",
-        ]
-
-        for item in checklist_items:
-            story.append(Paragraph(item, styles["Body"]))
-        story.append(Spacer(1, 10*mm))
+        story.append(_static("checklist"))
+        story.append(_divider())
 
-    # ===== 면책조항 =====
-    story.append(Spacer(1, 20*mm))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor("#E5E7EB")))
-    story.append(Spacer(1, 5*mm))
+        checklist_table = Table(_CHECKLIST_DATA, colWidths=[170*mm], hAlign='LEFT')
+        checklist_table.setStyle(_CHECKLIST_TABLE_STYLE)
+        story.append(checklist_table)
 
-    disclaimer = """
-    본 리포트는 참고용으로 제공되며, 투자 결정의 근거로 사용할 수 없습니다.
-    실제 투자 전 반드시 법률 전문가 및 부동산 전문가와 상담하시기 바랍니다.
-    서경아는 본 리포트의 내용에 대해 법적 책임을 지지 않습니다.
-    """
-    story.append(Paragraph(disclaimer.strip(), styles["Caption"]))
+    # ===== 면책조항 =====
+    # (분석/체크리스트 뒤 10mm + 면책 앞 20mm 여백을 구분선 여백으로 통합)
+    story.append(_divider(space_before=30*mm, space_after=5*mm))
+    story.append(_static("disclaimer"))
 
     # PDF 생성
     doc.build(story)
     buffer.seek(0)
-    return buffer.getvalue()
+    return buffer
 
 
 def get_report_filename(auction: Dict[str, Any]) -> str:
@@ -1,8 +1,34 @@
 """
 서경아 위험도 계산 (룰 기반, AI 없음)
 """
+import re
 from typing import Tuple, Dict, Any
 
+# 특수 권리 키워드
+DANGER_KEYWORDS = ('유치권', '법정지상권', '선순위전세권', '가등기', '지상권')
+CAUTION_KEYWORDS = ('임차인', '대항력', '점유', '명도', '가압류')
+
+# 키워드 → (위험도, 사유) 사전 계산, 두 목록을 한 번에 스캔
+_KEYWORD_VERDICTS = {
+    **{kw: ("위험", f"{kw} 존재") for kw in DANGER_KEYWORDS},
+    **{kw: ("주의", f"{kw} 있음 (확인 필요)") for kw in CAUTION_KEYWORDS},
+}
+_KEYWORD_RE = re.compile("|".join(map(re.escape, DANGER_KEYWORDS + CAUTION_KEYWORDS)))
+
+# 위험도 이모지
+RISK_EMOJIS = {
+    "안전": "🟢",
+    "주의": "🟡",
+    "위험": "🔴",
+}
+
+# 위험도 색상 (CSS)
+RISK_COLORS = {
+    "안전": "#27ae60",
+    "주의": "#f39c12",
+    "위험": "#e74c3c",
+}
+
 
 def calculate_risk(auction_data: Dict[str, Any]) -> Tuple[str, str]:
     """
@@ -18,23 +44,23 @@ def calculate_risk(auction_data: Dict[str, Any]) -> Tuple[str, str]:
     auction_count = auction_data.get('auction_count', 1)
     remarks = auction_data.get('remarks', '') or ''
 
-    # 특수 권리 키워드 체크
-    danger_keywords = ['유치권', '법정지상권', '선순위전세권', '가등기', '지상권']
-    caution_keywords = ['임차인', '대항력', '점유', '명도', '가압류']
-
-    # 위험 판정 - 특수 권리
-    for keyword in danger_keywords:
-        if keyword in remarks:
-            return "위험", f"{keyword} 존재"
+    # 키워드 1회 스캔 (위험 키워드가 나오면 즉시 중단, 주의는 첫 매칭만 보관)
+    caution_verdict = None
+    for match in _KEYWORD_RE.finditer(remarks):
+        verdict = _KEYWORD_VERDICTS[match.group(0)]
+        if verdict[0] == "위험":
+            # 위험 판정 - 특수 권리
+            return verdict
+        if caution_verdict is None:
+            caution_verdict = verdict
 
     # 위험 판정 - 선순위 권리
     if has_senior_rights:
         return "위험", "선순위 권리 존재"
 
     # 주의 판정 - 주의 키워드
-    for keyword in caution_keywords:
-        if keyword in remarks:
-            return "주의", f"{keyword} 있음 (확인 필요)"
+    if caution_verdict:
+        return caution_verdict
 
     # 주의 판정 - 임차인
     if has_tenant:
@@ -54,17 +80,9 @@ def calculate_risk(auction_data: Dict[str, Any]) -> Tuple[str, str]:
 
 def get_risk_emoji(risk_level: str) -> str:
     """위험도 이모지"""
-    return {
-        "안전": "🟢",
-        "주의": "🟡",
-        "위험": "🔴"
-    }.get(risk_level, "⚪")
+    return RISK_EMOJIS.get(risk_level, "⚪")
 
 
 def get_risk_color(risk_level: str) -> str:
     """위험도 색상 (CSS)"""
-    return {
-        "안전": "#27ae60",
-        "주의": "#f39c12",
-        "위험": "#e74c3c"
-    }.get(risk_level, "#999")
+    return RISK_COLORS.get(risk_level, "#999")
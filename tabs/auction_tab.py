@@ -2,8 +2,13 @@
 경매 탭 (필터 + 목록 + 지도)
 실제 법원경매 API 연동 (v2 - 신규 API)
 """
+import json
+import os
+import re
 import streamlit as st
 from datetime import date, timedelta, datetime
+from pathlib import Path
+from typing import Optional
 from database import (
     get_auctions, get_gugun_list, get_dong_list,
     is_favorite, add_favorite, remove_favorite, get_user_favorites
@@ -11,6 +16,7 @@ from database import (
 from components.auction_card import render_auction_list
 from components.auction_map import render_auction_map
 from components.auth import get_current_user_id
+from config import CACHE_DIR
 
 # 신규 API 크롤러 (v2)
 try:
@@ -26,6 +32,19 @@ except ImportError:
 from services.court_crawler import SEOUL_SGG_CODES
 
 
+# 아파트명 패턴 (아파트/타워/파크/빌라 접미사를 한 번에 스캔)
+_APT_NAME_RE = re.compile(r'([가-힣A-Za-z0-9]+(?:아파트|타워|파크|빌라))')
+
+
+def _is_apt_usage(usage: str) -> bool:
+    """아파트 계열 용도 여부 (아파트 / 주상복합 / 오피스텔, 제너레이터 없이 직접 검사)"""
+    return "아파트" in usage or "주상복합" in usage or "오피스텔" in usage
+
+# 실시간 검색 결과 디스크 캐시 (새 세션 / 재배포 후에도 최근 결과 표시)
+CRAWL_CACHE_DIR = Path(CACHE_DIR) / "crawl"
+CRAWL_CACHE_TTL = 86400  # 초 (1일)
+
+
 # 서울 구 목록
 SEOUL_GU_LIST = [
     "강남구", "강동구", "강북구", "강서구", "관악구",
@@ -35,7 +54,72 @@ SEOUL_GU_LIST = [
     "용산구", "은평구", "종로구", "중구", "중랑구"
 ]
 
+# 구 선택 옵션 (리런마다 리스트를 새로 만들지 않도록)
+GUGUN_OPTIONS = ["전체"] + SEOUL_GU_LIST
+
+# 경매 차수 옵션 (라벨 → 차수 목록)
+AUCTION_COUNT_OPTIONS = {
+    "전체": None,
+    "신건 (1차)": [1],
+    "2차": [2],
+    "3차 이상": [3, 4, 5, 6, 7, 8, 9, 10],
+}
+AUCTION_COUNT_LABELS = list(AUCTION_COUNT_OPTIONS)
+
+# 위험도 옵션
+RISK_LEVELS = ("안전", "주의", "위험")
+
+
+def _crawl_cache_path(gu_label: str, property_type: str) -> Path:
+    """검색 조건별 캐시 파일 경로"""
+    return CRAWL_CACHE_DIR / f"{gu_label}_{property_type}.json"
+
+
+def _save_crawl_cache(gu_label: str, property_type: str, items: list, total: int, crawled_time: datetime):
+    """검색 결과 디스크 저장 (임시 파일 → 교체, 실패 무시)"""
+    path = _crawl_cache_path(gu_label, property_type)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"items": items, "total": total, "time": crawled_time.isoformat()},
+                ensure_ascii=False,
+                default=str,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _load_crawl_cache(gu_label: str, property_type: str) -> Optional[dict]:
+    """
+    디스크에 저장된 검색 결과 조회
+
+    Returns:
+        {"items", "total", "time"(datetime)} 또는 None (없음 / 만료 / 손상)
+    """
+    path = _crawl_cache_path(gu_label, property_type)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["time"] = datetime.fromisoformat(data["time"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if (datetime.now() - data["time"]).total_seconds() > CRAWL_CACHE_TTL:
+        return None
+    return data
 
+
+@st.cache_resource(show_spinner=False)
+def _get_crawler() -> "CourtAuctionCrawlerV2":
+    """공유 크롤러 (세션 쿠키 / 연결 풀 재사용)"""
+    return CourtAuctionCrawlerV2()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
 def crawl_auctions_api(
     gu_name: str = None,
     page: int = 1,
@@ -53,65 +137,84 @@ def crawl_auctions_api(
 
     Returns:
         (물건 목록, 총 건수)
+
+    Note:
+        10분 캐시. 크롤러가 오류 결과를 돌려주면 RuntimeError로 올려
+        호출부에서 처리 (실패 결과가 빈 목록으로 캐시되지 않도록)
     """
     if not API_CRAWLER_AVAILABLE:
         return [], 0
 
-    try:
-        crawler = CourtAuctionCrawlerV2()
+    crawler = _get_crawler()
+
+    # 구 선택 시 시군구 코드로 서버 필터
+    # SEOUL_SGG_CODES 는 행정구역 5자리 (시도 2자리 + 시군구 3자리).
+    # rprsAdongSggCd 가 시군구 3자리만 받는다는 것은 실서버에서 확인되지 않은 가정이므로,
+    # 결과가 0건이면 구 코드 없이 다시 조회하고 아래 클라이언트 구 필터에 맡김
+    sgg_code = ""
+    if gu_name and gu_name != "전체":
+        sgg_code = SEOUL_SGG_CODES.get(gu_name, "")[2:]
+
+    result = crawler.search_auctions(
+        sido_code="11",  # 서울
+        sgg_code=sgg_code,
+        page=page,
+        page_size=page_size,
+    )
 
-        # 서울 전체 검색
+    if sgg_code and "error" not in result and not result.get("items"):
         result = crawler.search_auctions(
-            sido_code="11",  # 서울
+            sido_code="11",
             page=page,
             page_size=page_size,
         )
 
-        items = result.get("items", [])
-        total = result.get("total", 0)
+    # 크롤러는 예외 대신 error 키로 실패를 알림 → 캐시되지 않도록 예외로 전환
+    if "error" in result:
+        raise RuntimeError(result["error"])
+
+    items = result.get("items", [])
+    total = result.get("total", 0)
+
+    # 필터 여부는 루프 밖에서 한 번만 판단
+    gu_check = bool(gu_name) and gu_name != "전체"
+    apt_check = property_type == "아파트"
 
-        # 구 필터링
-        if gu_name and gu_name != "전체":
-            items = [
-                item for item in items
-                if gu_name in item.get("sigu", "") or gu_name in item.get("address", "")
-            ]
+    # 구 / 아파트 필터와 표준 형식 변환을 한 번의 순회로
+    formatted_items = []
+    for item in items:
+        address = item.get("address", "")
+        sigu = item.get("sigu", "")
+        usage_name = item.get("usage_name", "")
+
+        # 구 필터링 (코드 매핑이 없는 구 / 서버 필터 누락 대비)
+        if gu_check and gu_name not in sigu and gu_name not in address:
+            continue
 
         # 아파트 필터링
-        if property_type == "아파트":
-            items = [
-                item for item in items
-                if any(t in item.get("usage_name", "") for t in ["아파트", "주상복합", "오피스텔"])
-            ]
-
-        # 표준 형식으로 변환
-        formatted_items = []
-        for item in items:
-            formatted = {
-                "id": item.get("id", ""),
-                "case_no": item.get("case_no", ""),
-                "court": item.get("court_name", ""),
-                "apt_name": item.get("building_name") or extract_apt_name(item.get("address", "")),
-                "address": item.get("address", ""),
-                "addr1": item.get("sigu", ""),
-                "area": item.get("area_max", 0),
-                "appraisal_price": item.get("appraisal_price", 0),
-                "min_price": item.get("min_price", 0),
-                "auction_date": item.get("auction_date", ""),
-                "auction_count": item.get("bid_count", 1) + 1,  # 유찰+1 = 차수
-                "item_type": item.get("usage_name", ""),
-                "status": "진행",
-                "risk_level": calculate_risk(item),
-                "risk_reason": get_risk_reason(item),
-                "note": item.get("note", ""),
-            }
-            formatted_items.append(formatted)
-
-        return formatted_items, total
-
-    except Exception as e:
-        st.error(f"크롤링 오류: {e}")
-        return [], 0
+        if apt_check and not _is_apt_usage(usage_name):
+            continue
+
+        formatted_items.append({
+            "id": item.get("id", ""),
+            "case_no": item.get("case_no", ""),
+            "court": item.get("court_name", ""),
+            "apt_name": item.get("building_name") or extract_apt_name(address),
+            "address": address,
+            "addr1": sigu,
+            "area": item.get("area_max", 0),
+            "appraisal_price": item.get("appraisal_price", 0),
+            "min_price": item.get("min_price", 0),
+            "auction_date": item.get("auction_date", ""),
+            "auction_count": item.get("bid_count", 1) + 1,  # 유찰+1 = 차수
+            "item_type": usage_name,
+            "status": "진행",
+            "risk_level": calculate_risk(item),
+            "risk_reason": get_risk_reason(item),
+            "note": item.get("note", ""),
+        })
+
+    return formatted_items, total
 
 
 def extract_apt_name(address: str) -> str:
@@ -119,23 +222,16 @@ def extract_apt_name(address: str) -> str:
     if not address:
         return "경매물건"
 
-    # 아파트명 패턴
-    import re
-    patterns = [
-        r'([가-힣A-Za-z0-9]+아파트)',
-        r'([가-힣A-Za-z0-9]+타워)',
-        r'([가-힣A-Za-z0-9]+파크)',
-        r'([가-힣A-Za-z0-9]+빌라)',
-    ]
+    match = _APT_NAME_RE.search(address)
+    if match:
+        return match.group(1)
 
-    for pattern in patterns:
-        match = re.search(pattern, address)
-        if match:
-            return match.group(1)
-
-    # 못 찾으면 주소의 마지막 부분
-    parts = address.split()
-    return parts[-1] if parts else "경매물건"
+    # 못 찾으면 주소의 마지막 부분 (토큰 리스트를 만들지 않고 뒤에서 탐색)
+    address = address.rstrip()
+    if not address:
+        return "경매물건"
+    idx = address.rfind(" ")
+    return address[idx + 1:] if idx >= 0 else address
 
 
 def calculate_risk(item: dict) -> str:
@@ -161,37 +257,77 @@ def get_risk_reason(item: dict) -> str:
 
 
 def apply_filters(auctions: list, filters: dict) -> list:
-    """크롤링 결과에 필터 적용"""
-    result = auctions
-
-    # 가격 필터
-    if filters.get("min_price"):
-        result = [a for a in result if a.get("min_price", 0) >= filters["min_price"]]
-    if filters.get("max_price"):
-        result = [a for a in result if a.get("min_price", 0) <= filters["max_price"]]
-
-    # 경매 차수 필터
-    if filters.get("auction_counts"):
-        result = [a for a in result if a.get("auction_count", 1) in filters["auction_counts"]]
-
-    # 위험도 필터
-    if filters.get("risk_levels"):
-        result = [a for a in result if a.get("risk_level", "안전") in filters["risk_levels"]]
-
-    # 동 필터
-    if filters.get("dong"):
-        result = [a for a in result if filters["dong"] in a.get("address", "")]
-
-    # 물건 종류 필터
-    if filters.get("property_type") == "아파트":
-        result = [
-            a for a in result
-            if any(t in a.get("item_type", "") for t in ["아파트", "주상복합", "오피스텔"])
-        ]
+    """크롤링 결과에 필터 적용 (모든 조건을 한 번의 순회로 검사)"""
+    min_price = filters.get("min_price")
+    max_price = filters.get("max_price")
+    # frozenset으로 받으면 복사 없이 그대로 사용
+    auction_counts = frozenset(filters["auction_counts"]) if filters.get("auction_counts") else None
+    risk_levels = frozenset(filters["risk_levels"]) if filters.get("risk_levels") else None
+    dong = filters.get("dong")
+    apt_only = filters.get("property_type") == "아파트"
+
+    result = []
+    for a in auctions:
+        # 가격 필터
+        price = a.get("min_price", 0)
+        if min_price and price < min_price:
+            continue
+        if max_price and price > max_price:
+            continue
+
+        # 경매 차수 필터
+        if auction_counts and a.get("auction_count", 1) not in auction_counts:
+            continue
+
+        # 위험도 필터
+        if risk_levels and a.get("risk_level", "안전") not in risk_levels:
+            continue
+
+        # 동 필터
+        if dong and dong not in a.get("address", ""):
+            continue
+
+        # 물건 종류 필터
+        if apt_only and not _is_apt_usage(a.get("item_type", "")):
+            continue
+
+        result.append(a)
 
     return result
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_auctions_cached(
+    gugun: str = None,
+    dong: str = None,
+    min_price: int = None,
+    max_price: int = None,
+    auction_counts: tuple = None,
+    risk_levels: tuple = None,
+) -> list:
+    """캐시된 경매 물건 조회 (필터 조합별 1분, 리스트 인자는 튜플로 전달)"""
+    return get_auctions(
+        gugun=gugun,
+        dong=dong,
+        min_price=min_price,
+        max_price=max_price,
+        auction_counts=list(auction_counts) if auction_counts else None,
+        risk_levels=list(risk_levels) if risk_levels else None,
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_dong_list_cached(gugun: str) -> list:
+    """캐시된 동 목록 조회 (구→동 매핑은 거의 바뀌지 않으므로 1시간)"""
+    return get_dong_list(gugun)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_user_favorites_cached(user_id: int) -> list:
+    """캐시된 관심 물건 조회 (추가/제거 시 clear)"""
+    return get_user_favorites(user_id)
+
+
 def render_auction_tab():
     """경매 탭 렌더링 (신규 API 연동)"""
 
@@ -203,10 +339,9 @@ def render_auction_tab():
 
         # 지역 필터
         st.markdown("##### 지역")
-        gugun_options = ["전체"] + SEOUL_GU_LIST
         selected_gugun = st.selectbox(
             "구 선택",
-            gugun_options,
+            GUGUN_OPTIONS,
             key="filter_gugun",
             label_visibility="collapsed"
         )
@@ -214,7 +349,7 @@ def render_auction_tab():
         # 동 선택 (구 선택 시)
         selected_dong = None
         if selected_gugun and selected_gugun != "전체":
-            dong_list = get_dong_list(selected_gugun)
+            dong_list = get_dong_list_cached(selected_gugun)
             if dong_list:
                 dong_options = ["전체"] + dong_list
                 selected_dong = st.selectbox(
@@ -228,61 +363,60 @@ def render_auction_tab():
 
         st.markdown("---")
 
-        # 물건 종류 필터
-        st.markdown("##### 물건 종류")
-        property_type = st.radio(
-            "종류 선택",
-            ["아파트", "전체"],
-            key="filter_property",
-            label_visibility="collapsed"
-        )
-
-        st.markdown("---")
-
-        # 가격 필터
-        st.markdown("##### 가격 (최저가 기준)")
-        price_range = st.slider(
-            "가격 범위 (억)",
-            min_value=0,
-            max_value=50,
-            value=(0, 50),
-            step=1,
-            key="filter_price",
-            label_visibility="collapsed"
-        )
-        min_price = price_range[0] * 100000000 if price_range[0] > 0 else None
-        max_price = price_range[1] * 100000000 if price_range[1] < 50 else None
-
-        st.markdown("---")
-
-        # 경매 차수 필터
-        st.markdown("##### 경매 차수")
-        auction_count_options = {
-            "전체": None,
-            "신건 (1차)": [1],
-            "2차": [2],
-            "3차 이상": [3, 4, 5, 6, 7, 8, 9, 10],
-        }
-        selected_count = st.radio(
-            "차수 선택",
-            list(auction_count_options.keys()),
-            key="filter_count",
-            label_visibility="collapsed"
-        )
-        auction_counts = auction_count_options[selected_count]
+        # 물건 종류 / 가격 / 차수 / 위험도는 폼으로 묶어 [적용] 시 한 번만 rerun
+        # (구/동은 동 목록이 구 선택에 따라 바뀌므로 폼 밖에 둠)
+        with st.form("filter_form", border=False):
+            # 물건 종류 필터
+            st.markdown("##### 물건 종류")
+            property_type = st.radio(
+                "종류 선택",
+                ["아파트", "전체"],
+                key="filter_property",
+                label_visibility="collapsed"
+            )
 
-        st.markdown("---")
+            st.markdown("---")
+
+            # 가격 필터
+            st.markdown("##### 가격 (최저가 기준)")
+            price_range = st.slider(
+                "가격 범위 (억)",
+                min_value=0,
+                max_value=50,
+                value=(0, 50),
+                step=1,
+                key="filter_price",
+                label_visibility="collapsed"
+            )
+            min_price = price_range[0] * 100000000 if price_range[0] > 0 else None
+            max_price = price_range[1] * 100000000 if price_range[1] < 50 else None
+
+            st.markdown("---")
+
+            # 경매 차수 필터
+            st.markdown("##### 경매 차수")
+            selected_count = st.radio(
+                "차수 선택",
+                AUCTION_COUNT_LABELS,
+                key="filter_count",
+                label_visibility="collapsed"
+            )
+            auction_counts = AUCTION_COUNT_OPTIONS[selected_count]
+
+            st.markdown("---")
+
+            # 위험도 필터
+            st.markdown("##### 위험도")
+            risk_options = st.multiselect(
+                "위험도 선택",
+                RISK_LEVELS,
+                default=RISK_LEVELS,
+                key="filter_risk",
+                label_visibility="collapsed"
+            )
+            risk_levels = risk_options if risk_options else None
 
-        # 위험도 필터
-        st.markdown("##### 위험도")
-        risk_options = st.multiselect(
-            "위험도 선택",
-            ["안전", "주의", "위험"],
-            default=["안전", "주의", "위험"],
-            key="filter_risk",
-            label_visibility="collapsed"
-        )
-        risk_levels = risk_options if risk_options else None
+            st.form_submit_button("✅ 적용", use_container_width=True)
 
         st.markdown("---")
 
@@ -292,6 +426,8 @@ def render_auction_tab():
                         'filter_count', 'filter_risk', 'filter_property']:
                 if key in st.session_state:
                     del st.session_state[key]
+            get_auctions_cached.clear()
+            crawl_auctions_api.clear()
             st.rerun()
 
     # 메인 컨텐츠
@@ -335,27 +471,49 @@ def render_auction_tab():
         target_gu = selected_gugun if selected_gugun != "전체" else None
 
         with st.spinner(f"서울 경매 물건을 검색 중입니다..."):
-            crawled_items, total = crawl_auctions_api(
-                gu_name=target_gu,
-                page=1,
-                page_size=100,
-                property_type=property_type
-            )
+            try:
+                crawled_items, total = crawl_auctions_api(
+                    gu_name=target_gu,
+                    page=1,
+                    page_size=100,
+                    property_type=property_type
+                )
+            except Exception as e:
+                st.error(f"크롤링 오류: {e}")
+                crawled_items, total = [], 0
 
             if crawled_items:
+                crawled_time = datetime.now()
                 st.session_state["crawled_auctions"] = crawled_items
                 st.session_state["crawled_total"] = total
-                st.session_state["crawled_time"] = datetime.now()
+                st.session_state["crawled_time"] = crawled_time
                 st.session_state["crawled_gu"] = target_gu or "서울 전체"
+                _save_crawl_cache(
+                    target_gu or "서울 전체", property_type, crawled_items, total, crawled_time
+                )
                 st.success(f"**{len(crawled_items)}**개 물건 검색 완료! (전체 {total:,}건)")
             else:
                 st.warning("검색 결과가 없습니다.")
 
     st.markdown("---")
 
+    # 새 세션이면 같은 조건의 최근 검색 결과를 디스크에서 복원
+    if "crawled_auctions" not in st.session_state:
+        gu_label = selected_gugun if selected_gugun != "전체" else "서울 전체"
+        cached = _load_crawl_cache(gu_label, property_type)
+        if cached:
+            st.session_state["crawled_auctions"] = cached["items"]
+            st.session_state["crawled_total"] = cached["total"]
+            st.session_state["crawled_time"] = cached["time"]
+            st.session_state["crawled_gu"] = gu_label
+
+    # 관심 물건 (목록 조회 / 별표 표시에 같이 사용)
+    favorites_list = get_user_favorites_cached(user_id) if user_id else []
+    favorite_ids = {f['id'] for f in favorites_list}
+
     # 데이터 조회
     if show_favorites and user_id:
-        auctions = get_user_favorites(user_id)
+        auctions = favorites_list
         total_count = len(auctions)
         data_source = "favorites"
     elif "crawled_auctions" in st.session_state and st.session_state.get("crawled_auctions"):
@@ -365,8 +523,8 @@ def render_auction_tab():
         filters = {
             "min_price": min_price,
             "max_price": max_price,
-            "auction_counts": auction_counts,
-            "risk_levels": risk_levels,
+            "auction_counts": frozenset(auction_counts) if auction_counts else None,
+            "risk_levels": frozenset(risk_levels) if risk_levels else None,
             "dong": selected_dong,
             "property_type": property_type,
         }
@@ -376,13 +534,13 @@ def render_auction_tab():
         data_source = "crawled"
     else:
         # 샘플 데이터
-        auctions = get_auctions(
+        auctions = get_auctions_cached(
             gugun=selected_gugun if selected_gugun != "전체" else None,
             dong=selected_dong,
             min_price=min_price,
             max_price=max_price,
-            auction_counts=auction_counts,
-            risk_levels=risk_levels,
+            auction_counts=tuple(auction_counts) if auction_counts else None,
+            risk_levels=tuple(risk_levels) if risk_levels else None,
         )
         total_count = len(auctions)
         data_source = "database"
@@ -400,12 +558,6 @@ def render_auction_tab():
     elif data_source == "database":
         st.info("💡 샘플 데이터입니다. **[🔄 실시간 검색]** 버튼을 눌러 실제 데이터를 가져오세요.")
 
-    # 관심 물건 ID
-    favorite_ids = set()
-    if user_id:
-        favorites = get_user_favorites(user_id)
-        favorite_ids = {f['id'] for f in favorites}
-
     def handle_favorite_click(auction_id):
         if not user_id:
             st.warning("로그인이 필요합니다.")
@@ -417,6 +569,7 @@ def render_auction_tab():
         else:
             add_favorite(user_id, auction_id)
             st.toast("관심 물건에 추가되었습니다.")
+        get_user_favorites_cached.clear()
         st.rerun()
 
     # 뷰 렌더링
@@ -428,21 +581,8 @@ def render_auction_tab():
             on_favorite_click=handle_favorite_click
         )
     else:
-        auction_dicts = []
-        for a in auctions:
-            if hasattr(a, '__dict__'):
-                auction_dicts.append({
-                    'id': a.id,
-                    'apt_name': a.apt_name,
-                    'lat': a.lat,
-                    'lng': a.lng,
-                    'min_price': a.min_price,
-                    'risk_level': a.risk_level,
-                })
-            else:
-                auction_dicts.append(a)
-
-        render_auction_map(auction_dicts)
+        # DB(auction_to_dict) / 관심 물건 / 크롤링 결과 모두 dict 리스트
+        render_auction_map(auctions)
 
     if not auctions:
         st.info("조건에 맞는 물건이 없습니다. 필터를 조정하거나 **[🔄 실시간 검색]**을 눌러보세요.")
@@ -4,17 +4,49 @@
 """
 import streamlit as st
 import json
+import re
+from collections import deque
 from services.court_crawler import (
     CourtAuctionCrawler,
     COURT_CODES,
     SEOUL_COURTS,
     format_case_number_for_api
 )
-from services import (
-    analyze_auction, generate_auction_report, get_report_filename,
-    generate_appraisal_summary
+from services import analyze_auction, generate_appraisal_summary
+
+# PDF 리포트(reportlab) / 위험도 차트(plotly)는 사용 시점에 import
+
+# 빠른 JSON 직렬화 (선택적 import)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# 최근 조회 기록 보관 개수 (초과 시 오래된 것부터 제거)
+HISTORY_SIZE = 5
+
+# 일괄 조회 입력 구분자 (줄바꿈 / 쉼표 / 공백)
+_CASE_NO_SPLIT_RE = re.compile(r"[\s,]+")
+
+# 법원 선택 옵션 (서울 법원을 먼저 표시, 리런마다 다시 나누지 않음)
+_SORTED_COURTS = (
+    [c for c in COURT_CODES if "서울" in c]
+    + [c for c in COURT_CODES if "서울" not in c]
 )
-from components.risk_chart import render_risk_radar_chart
+
+
+def _pretty_json(data) -> str:
+    """원본 데이터 표시용 JSON 문자열 (orjson 우선, 실패 시 표준 json)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2, default=str)
 
 
 def render_case_lookup():
@@ -32,15 +64,9 @@ def render_case_lookup():
 
         with col1:
             # 법원 선택
-            court_options = list(COURT_CODES.keys())
-            # 서울 법원을 먼저 표시
-            seoul_courts = [c for c in court_options if "서울" in c]
-            other_courts = [c for c in court_options if "서울" not in c]
-            sorted_courts = seoul_courts + other_courts
-
             selected_court = st.selectbox(
                 "법원 선택",
-                sorted_courts,
+                _SORTED_COURTS,
                 index=0,
                 help="물건이 등록된 법원을 선택하세요"
             )
@@ -53,6 +79,13 @@ def render_case_lookup():
                 help="'타경' 포함 전체 사건번호를 입력하세요"
             )
 
+        # 여러 건 일괄 조회 (선택)
+        extra_case_nos = st.text_area(
+            "함께 조회할 사건번호 (선택)",
+            placeholder="여러 건을 조회하려면 한 줄에 하나씩 입력하세요",
+            height=80,
+        )
+
         # 조회할 정보 선택
         info_types = st.multiselect(
             "조회할 정보",
@@ -86,17 +119,26 @@ def render_case_lookup():
         # 크롤러 초기화
         crawler = CourtAuctionCrawler()
 
-        # 각 정보 유형별 조회
-        results = {}
+        # 추가 사건번호가 있으면 일괄 조회
+        case_nos = list(dict.fromkeys(
+            [case_no.strip()] + [c for c in _CASE_NO_SPLIT_RE.split(extra_case_nos) if c]
+        ))
+        if len(case_nos) > 1:
+            invalid = [c for c in case_nos if "타경" not in c]
+            if invalid:
+                st.error(f"사건번호 형식 오류: {', '.join(invalid)}")
+                return
+            render_batch_lookup(crawler, selected_court, case_nos, info_types)
+            render_recent_lookups()
+            return
 
+        # 정보 유형별 동시 조회 (탭별 실패는 None, 다른 탭에 영향 없음)
         with st.spinner(f"'{case_no}' 조회 중..."):
-            for info_type in info_types:
-                result = crawler.get_case_detail(
-                    court_name=selected_court,
-                    case_no=case_no,
-                    tab=info_type
-                )
-                results[info_type] = result
+            results = crawler.get_case_detail_all(
+                court_name=selected_court,
+                case_no=case_no,
+                tabs=info_types
+            )
 
         # 결과 표시
         if any(results.values()):
@@ -138,32 +180,39 @@ def display_result(info_type: str, data: dict, case_no: str, court: str):
 
     st.subheader(f"📋 {info_type}")
 
-    if info_type == "사건내역":
-        display_case_info(data)
-    elif info_type == "기일내역":
-        display_schedule_info(data)
-    elif info_type == "문건송달내역":
-        display_document_info(data)
+    handler = _DISPLAY_HANDLERS.get(info_type)
+    if handler:
+        handler(data)
 
     # 원본 데이터 보기 (접기)
     with st.expander("🔧 원본 데이터 (개발자용)"):
-        st.json(data)
+        # 한 번 직렬화한 문자열을 그대로 표시 (st.json 내부 재직렬화 생략)
+        st.code(_pretty_json(data), language="json")
+
+
+def _as_items(data) -> list:
+    """
+    API 응답을 항목 리스트로 정규화
+
+    Args:
+        data: {"list": [...]} / 리스트 / 단일 딕셔너리
+
+    Returns:
+        항목 리스트 (데이터 없으면 빈 리스트)
+    """
+    if isinstance(data, dict):
+        return data.get("list", [data])
+    if isinstance(data, list):
+        return data
+    return [data] if data else []
 
 
 def display_case_info(data: dict):
     """사건내역 표시"""
 
     # 기본 정보 추출 (API 응답 구조에 따라 조정 필요)
-    if isinstance(data, dict):
-        # 리스트인 경우
-        if "list" in data:
-            items = data["list"]
-        elif isinstance(data, list):
-            items = data
-        else:
-            items = [data]
-
-        for item in items[:5]:  # 최대 5개
+    if isinstance(data, (dict, list)):
+        for item in _as_items(data)[:5]:  # 최대 5개
             if isinstance(item, dict):
                 col1, col2 = st.columns(2)
 
@@ -194,12 +243,7 @@ def display_case_info(data: dict):
 def display_schedule_info(data: dict):
     """기일내역 표시"""
 
-    if isinstance(data, dict) and "list" in data:
-        items = data["list"]
-    elif isinstance(data, list):
-        items = data
-    else:
-        items = [data] if data else []
+    items = _as_items(data)
 
     if items:
         for item in items[:10]:
@@ -218,12 +262,7 @@ def display_schedule_info(data: dict):
 def display_document_info(data: dict):
     """문건송달내역 표시"""
 
-    if isinstance(data, dict) and "list" in data:
-        items = data["list"]
-    elif isinstance(data, list):
-        items = data
-    else:
-        items = [data] if data else []
+    items = _as_items(data)
 
     if items:
         for item in items[:10]:
@@ -237,6 +276,39 @@ def display_document_info(data: dict):
         st.info("문건송달내역이 없습니다.")
 
 
+# 정보 유형별 표시 함수
+_DISPLAY_HANDLERS = {
+    "사건내역": display_case_info,
+    "기일내역": display_schedule_info,
+    "문건송달내역": display_document_info,
+}
+
+
+def render_batch_lookup(crawler: CourtAuctionCrawler, court: str, case_nos: list, info_types: list):
+    """여러 사건번호 일괄 조회 결과 표시 (사건별 탭)"""
+
+    with st.spinner(f"{len(case_nos)}건 조회 중..."):
+        batch_results = crawler.get_case_detail_many(
+            court_name=court,
+            case_nos=case_nos,
+            tabs=info_types
+        )
+
+    found = [c for c in case_nos if any(batch_results[c].values())]
+    if not found:
+        st.warning("조회 결과가 없습니다. 사건번호와 법원을 확인해주세요.")
+        return
+
+    st.success(f"✅ 조회 완료: {court} {len(found)}/{len(case_nos)}건")
+    st.caption("AI 분석 / PDF 리포트는 단건 조회에서 제공됩니다.")
+
+    case_tabs = st.tabs(case_nos)
+    for case_tab, batch_case_no in zip(case_tabs, case_nos):
+        with case_tab:
+            for info_type in info_types:
+                display_result(info_type, batch_results[batch_case_no][info_type], batch_case_no, court)
+
+
 def render_ai_analysis(results: dict, case_no: str, court: str):
     """AI 분석 섹션"""
 
@@ -311,6 +383,7 @@ def render_ai_analysis(results: dict, case_no: str, court: str):
     with col2:
         # 위험도 차트
         st.markdown("### 위험도 평가")
+        from components.risk_chart import render_risk_radar_chart
         render_risk_radar_chart(auction_data)
 
     # 이전 분석 결과 표시
@@ -331,6 +404,8 @@ def render_ai_analysis(results: dict, case_no: str, court: str):
             if st.button("📄 PDF 리포트 생성", use_container_width=True):
                 with st.spinner("PDF 생성 중..."):
                     try:
+                        from services import generate_auction_report, get_report_filename
+
                         # 감정평가 요약 또는 권리분석 사용
                         if f"appraisal_summary_{case_no}" in st.session_state:
                             analysis = st.session_state[f"appraisal_summary_{case_no}"]
@@ -363,16 +438,13 @@ def render_recent_lookups():
     """최근 조회 기록"""
 
     # 세션에서 조회 기록 가져오기
-    if "lookup_history" not in st.session_state:
-        st.session_state.lookup_history = []
-
-    history = st.session_state.lookup_history
+    history = st.session_state.setdefault("lookup_history", deque(maxlen=HISTORY_SIZE))
 
     if history:
         st.divider()
         st.subheader("📜 최근 조회")
 
-        for item in history[-5:][::-1]:  # 최근 5개, 역순
+        for item in reversed(history):  # 최근 순
             st.markdown(f"- {item['court']} **{item['case_no']}** ({item['time']})")
 
 
@@ -380,10 +452,8 @@ def add_to_history(court: str, case_no: str):
     """조회 기록 추가"""
     from datetime import datetime
 
-    if "lookup_history" not in st.session_state:
-        st.session_state.lookup_history = []
-
-    st.session_state.lookup_history.append({
+    history = st.session_state.setdefault("lookup_history", deque(maxlen=HISTORY_SIZE))
+    history.append({
         "court": court,
         "case_no": case_no,
         "time": datetime.now().strftime("%m/%d %H:%M")